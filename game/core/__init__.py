@@ -1,6 +1,6 @@
 """Core game systems."""
-from .app import App
+from .app import App, GameData
 from .state import GameState, StateManager, StateID
-from .assets import Assets
+from .assets import Assets, get_assets
 
-__all__ = ["App", "GameState", "StateManager", "StateID", "Assets"]
\ No newline at end of file
+__all__ = ["App", "GameData", "GameState", "StateManager", "StateID", "Assets", "get_assets"]
\ No newline at end of file
@@ -1,9 +1,49 @@
 """Main application class managing the game loop and core systems."""
 import pygame
-from typing import Dict, Any, Optional
+from typing import Dict, List, Optional
+from dataclasses import dataclass, field
 import time
 
 from .state import StateManager, StateID
+from .assets import get_assets
+
+
+# States that ESC never pauses
+_UNPAUSABLE_STATES = frozenset((StateID.MAIN_MENU, StateID.DIALOGUE))
+
+# Window events after which the screen must be repainted even if the state is idle.
+# pygame 2 reports these as separate WINDOW* types rather than a single WINDOWEVENT.
+_REDRAW_EVENTS = frozenset((
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWSHOWN,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWMAXIMIZED,
+    pygame.WINDOWSIZECHANGED,
+))
+
+# Event types the states handle; everything else is dropped by SDL before reaching Python.
+# MOUSEMOTION stays allowed because buttons use it for hover state.
+_HANDLED_EVENTS = [
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    *_REDRAW_EVENTS,
+]
+
+
+@dataclass(slots=True)
+class GameData:
+    """Persistent run data shared between states."""
+    coins: int = 10
+    day: int = 1
+    customers_served: int = 0
+    total_tips: int = 0
+    upgrades: List[str] = field(default_factory=list)
+    modifiers: Dict[str, float] = field(default_factory=dict)
 
 
 class App:
@@ -11,6 +51,8 @@ class App:
     
     def __init__(self, width: int = 960, height: int = 540, title: str = "Eldritch Espresso") -> None:
         """Initialize the application."""
+        # All generated sounds are mono, so open the mixer mono to halve mixing work
+        pygame.mixer.pre_init(frequency=22050, size=-16, channels=1, buffer=512)
         pygame.init()
         pygame.mixer.init()
         
@@ -21,64 +63,85 @@ class App:
         self.clock = pygame.time.Clock()
         self.screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption(title)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(_HANDLED_EVENTS)
+        
+        # Build assets after set_mode so their surfaces match the display format
+        get_assets()
         
         # Core systems
         self.state_manager = StateManager()
         
         # Game state
-        self.game_data: Dict[str, Any] = {
-            "coins": 10,
-            "day": 1,
-            "upgrades": [],
-            "modifiers": {},
-            "customers_served": 0,
-            "total_tips": 0
-        }
+        self.game_data = GameData()
         
         # Fixed timestep
         self.fixed_timestep = 1.0 / 60.0  # 60 FPS
         self.accumulator = 0.0
-        self.last_time = time.time()
+        self.last_time = time.perf_counter()
     
     def run(self) -> None:
         """Run the main game loop."""
         self.running = True
         
+        # Bind event constants locally; the event loop below is hot during input bursts
+        QUIT = pygame.QUIT
+        KEYDOWN = pygame.KEYDOWN
+        K_ESCAPE = pygame.K_ESCAPE
+        PAUSE = StateID.PAUSE
+        get_events = pygame.event.get
+        state_manager = self.state_manager
+        # These dispatch to whichever state is current, so they stay valid across changes
+        handle_event = state_manager.handle_event
+        update_state = state_manager.update
+        
         while self.running:
             # Calculate delta time
-            current_time = time.time()
+            current_time = time.perf_counter()
             frame_time = min(current_time - self.last_time, 0.25)  # Cap at 0.25s
             self.last_time = current_time
             self.accumulator += frame_time
             
             # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            for event in get_events():
+                if event.type == QUIT:
                     self.running = False
-                elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                elif event.type == KEYDOWN and event.key == K_ESCAPE:
                     # Handle pause
-                    current_state = self.state_manager.get_current_state_id()
-                    if current_state == StateID.PAUSE:
+                    current_state = state_manager.current_state_id
+                    if current_state == PAUSE:
                         # Unpause - return to previous state
-                        if self.state_manager.previous_state_id:
-                            self.state_manager.change_state(self.state_manager.previous_state_id)
-                    elif current_state not in [StateID.MAIN_MENU, StateID.DIALOGUE]:
+                        if state_manager.previous_state_id:
+                            state_manager.change_state(state_manager.previous_state_id)
+                    elif current_state not in _UNPAUSABLE_STATES:
                         # Pause game
-                        self.state_manager.change_state(StateID.PAUSE)
+                        state_manager.change_state(PAUSE)
+                elif event.type in _REDRAW_EVENTS:
+                    # Window was uncovered or restored; an idle state must draw again
+                    current = state_manager.current_state
+                    if current is not None:
+                        current.dirty = True
                 else:
-                    self.state_manager.handle_event(event)
+                    handle_event(event)
             
             # Fixed timestep update
             while self.accumulator >= self.fixed_timestep:
-                self.state_manager.update(self.fixed_timestep)
+                update_state(self.fixed_timestep)
                 self.accumulator -= self.fixed_timestep
             
+            # Idle at a low rate while the screen is static and no input is pending
+            current = state_manager.current_state
+            if current is not None and not current.dirty and not pygame.event.peek():
+                self.clock.tick(10)
+                continue
+            
             # Render
-            self.screen.fill((20, 20, 30))  # Dark background
-            self.state_manager.draw(self.screen)
+            if current is None or not current.clears_background:
+                self.screen.fill((20, 20, 30))  # Dark background
+            state_manager.draw(self.screen)
             pygame.display.flip()
             
-            # Cap framerate
+            # Cap framerate; this is the only pacing, the accumulator just consumes elapsed time
             self.clock.tick(60)
         
         self.quit()
@@ -94,4 +157,4 @@ class App:
     
     def get_modifiers(self) -> Dict[str, float]:
         """Get active game modifiers from upgrades."""
-        return self.game_data.get("modifiers", {})
\ No newline at end of file
+        return self.game_data.modifiers
\ No newline at end of file
@@ -1,9 +1,43 @@
 """Asset loading and management with fallback shape generation."""
 import pygame
 import os
+import math
 from typing import Dict, Optional, Tuple
 import pygame.freetype
 
+try:
+    import numpy as np
+except ImportError:
+    # Sounds fall back to silence without numpy
+    np = None
+
+
+def _star_offsets(outer: float, inner: float, points: int = 5) -> Tuple[Tuple[float, float], ...]:
+    """Vertex offsets of a star centered on the origin, first point straight up."""
+    offsets = []
+    for i in range(points * 2):
+        angle = i * math.pi / points
+        r = outer if i % 2 == 0 else inner
+        offsets.append((r * math.sin(angle), -r * math.cos(angle)))
+    return tuple(offsets)
+
+
+# Star icon vertex offsets from the icon center
+_STAR_OFFSETS = _star_offsets(12, 6)
+
+# UI element (fill, border) colors
+_UI_ELEMENT_COLORS = {
+    "button_normal": ((80, 80, 100), (100, 100, 120)),
+    "button_hover": ((100, 100, 120), (120, 120, 140)),
+    "button_pressed": ((60, 60, 80), (80, 80, 100)),
+    "panel": ((40, 40, 50), (60, 60, 70)),
+}
+
+# Characters rendered once per font at startup so freetype has their glyphs cached
+_GLYPH_WARMUP_CHARS = (
+    "0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ .,!?$%:;-/'()*+"
+)
+
 
 class Assets:
     """Manages game assets with fallback shape generation."""
@@ -12,6 +46,13 @@ class Assets:
         """Initialize asset manager."""
         self.images: Dict[str, pygame.Surface] = {}
         self.sounds: Dict[str, pygame.mixer.Sound] = {}
+        self.playing_channels: Dict[str, pygame.mixer.Channel] = {}
+        self._synth_scratch: Optional["np.ndarray"] = None
+        
+        # Placeholders are built once and shared by every miss
+        self._failed_paths: set[str] = set()
+        self._load_placeholder = self._create_load_placeholder()
+        self._missing_image = self._create_placeholder()
         self.fonts: Dict[str, pygame.freetype.Font] = {}
         
         # Initialize pygame font system
@@ -23,6 +64,10 @@ class Assets:
         self.fonts['medium'] = pygame.freetype.Font(None, 20)
         self.fonts['small'] = pygame.freetype.Font(None, 14)
         
+        # Rasterize common glyphs now rather than on the first frames that use them
+        for font in self.fonts.values():
+            font.render(_GLYPH_WARMUP_CHARS, (255, 255, 255))
+        
         # Generate fallback shapes
         self._generate_fallback_shapes()
         
@@ -45,14 +90,16 @@ class Assets:
         self._create_ingredient_icon("sigil", (148, 0, 211))
         
         # UI elements
-        self._create_ui_element("button_normal", (80, 80, 100))
-        self._create_ui_element("button_hover", (100, 100, 120))
-        self._create_ui_element("button_pressed", (60, 60, 80))
-        self._create_ui_element("panel", (40, 40, 50))
+        for name in _UI_ELEMENT_COLORS:
+            self._create_ui_element(name)
         
         # Special effects
         self._create_portal_sprite()
         self._create_thermometer_icon()
+        
+        # Match the display pixel format so per-frame blits take SDL's fast path
+        for name, surf in self.images.items():
+            self.images[name] = surf.convert_alpha()
     
     def _create_customer_shape(self, name: str, color: Tuple[int, int, int], shape: str) -> None:
         """Create a customer silhouette shape."""
@@ -98,18 +145,7 @@ class Assets:
             pygame.draw.polygon(surf, color, points)
         elif name in ["stardust", "meteor_shot"]:
             # Star shape
-            center = (16, 16)
-            size = 12
-            points = []
-            for i in range(10):
-                angle = i * 3.14159 / 5
-                if i % 2 == 0:
-                    r = size
-                else:
-                    r = size * 0.5
-                x = center[0] + r * pygame.math.Vector2(0, -1).rotate_rad(angle).x
-                y = center[1] + r * pygame.math.Vector2(0, -1).rotate_rad(angle).y
-                points.append((x, y))
+            points = [(16 + dx, 16 + dy) for dx, dy in _STAR_OFFSETS]
             pygame.draw.polygon(surf, color, points)
         elif name == "sigil":
             # Mystical symbol
@@ -120,17 +156,17 @@ class Assets:
         
         self.images[f"ingredient_{name}"] = surf
     
-    def _create_ui_element(self, name: str, color: Tuple[int, int, int]) -> None:
+    def _create_ui_element(self, name: str) -> None:
         """Create a UI element."""
+        fill, border = _UI_ELEMENT_COLORS[name]
         if name.startswith("button"):
             surf = pygame.Surface((120, 40), pygame.SRCALPHA)
-            pygame.draw.rect(surf, color, (0, 0, 120, 40), border_radius=5)
-            pygame.draw.rect(surf, (color[0] + 20, color[1] + 20, color[2] + 20), 
-                           (0, 0, 120, 40), 2, border_radius=5)
+            pygame.draw.rect(surf, fill, (0, 0, 120, 40), border_radius=5)
+            pygame.draw.rect(surf, border, (0, 0, 120, 40), 2, border_radius=5)
         else:  # panel
             surf = pygame.Surface((200, 150), pygame.SRCALPHA)
-            pygame.draw.rect(surf, color, (0, 0, 200, 150), border_radius=8)
-            pygame.draw.rect(surf, (60, 60, 70), (0, 0, 200, 150), 2, border_radius=8)
+            pygame.draw.rect(surf, fill, (0, 0, 200, 150), border_radius=8)
+            pygame.draw.rect(surf, border, (0, 0, 200, 150), 2, border_radius=8)
         
         self.images[name] = surf
     
@@ -159,18 +195,17 @@ class Assets:
         """Load an image from file or return existing."""
         if name in self.images:
             return self.images[name]
+        if path in self._failed_paths:
+            return self._load_placeholder
         
         try:
             image = pygame.image.load(path).convert_alpha()
             self.images[name] = image
             return image
-        except:
-            # Return a placeholder
-            placeholder = pygame.Surface((64, 64), pygame.SRCALPHA)
-            pygame.draw.rect(placeholder, (255, 0, 255), (0, 0, 64, 64))
-            pygame.draw.line(placeholder, (0, 0, 0), (0, 0), (64, 64), 2)
-            pygame.draw.line(placeholder, (0, 0, 0), (64, 0), (0, 64), 2)
-            return placeholder
+        except (pygame.error, FileNotFoundError):
+            # Remember the failure so retries don't hit the filesystem again
+            self._failed_paths.add(path)
+            return self._load_placeholder
     
     def load_sound(self, name: str, path: str) -> Optional[pygame.mixer.Sound]:
         """Load a sound from file or return existing."""
@@ -186,7 +221,7 @@ class Assets:
     
     def get_image(self, name: str) -> pygame.Surface:
         """Get an image by name."""
-        return self.images.get(name, self._create_placeholder())
+        return self.images.get(name, self._missing_image)
     
     def get_sound(self, name: str) -> Optional[pygame.mixer.Sound]:
         """Get a sound by name."""
@@ -202,11 +237,17 @@ class Assets:
         pygame.draw.rect(surf, (255, 0, 255), (0, 0, 64, 64), 2)
         return surf
     
+    def _create_load_placeholder(self) -> pygame.Surface:
+        """Create the placeholder returned for images that failed to load."""
+        surf = pygame.Surface((64, 64), pygame.SRCALPHA)
+        pygame.draw.rect(surf, (255, 0, 255), (0, 0, 64, 64))
+        pygame.draw.line(surf, (0, 0, 0), (0, 0), (64, 64), 2)
+        pygame.draw.line(surf, (0, 0, 0), (64, 0), (0, 64), 2)
+        return surf
+    
     def _generate_fallback_sounds(self) -> None:
         """Generate simple placeholder sounds."""
-        try:
-            import numpy as np
-            
+        if np is not None:
             # Generate simple tones
             sample_rate = 22050
             duration = 0.2  # 200ms
@@ -220,124 +261,156 @@ class Assets:
             # Background loop - simple chord
             self._generate_background("background_music", 2.0, sample_rate)
             
-        except ImportError:
-            # If numpy not available, create silent sounds
-            pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
-            silence = pygame.sndarray.make_sound(np.zeros((22050, 2), dtype=np.int16))
-            self.sounds["ding"] = silence
-            self.sounds["whoosh"] = silence
-            self.sounds["background_music"] = silence
+            # Synthesis is done; release the shared work buffers
+            self._synth_scratch = None
+        
+        # Anything numpy couldn't produce plays as silence
+        missing = [name for name in ("ding", "whoosh", "background_music") if name not in self.sounds]
+        if missing:
+            frequency, _, channels = pygame.mixer.get_init()
+            silence = pygame.mixer.Sound(buffer=bytes(frequency * channels * 2))  # 1s of 16-bit silence
+            for name in missing:
+                self.sounds[name] = silence
+    
+    def _synth_buffers(self, samples: int) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+        """Return (ramp, waves, work) float32 views of length `samples` into shared scratch.
+        
+        `ramp` holds the sample indices 0..samples-1 and must not be written to.
+        """
+        if self._synth_scratch is None or self._synth_scratch.shape[1] < samples:
+            # Sized for the longest sound (the 2s background loop) on first use
+            size = max(samples, 1 << 16)
+            self._synth_scratch = np.empty((3, size), dtype=np.float32)
+            self._synth_scratch[0] = np.arange(size, dtype=np.float32)
+        ramp, waves, work = self._synth_scratch[:, :samples]
+        return ramp, waves, work
     
     def _generate_tone(self, name: str, frequency: float, duration: float, sample_rate: int) -> None:
         """Generate a simple tone."""
+        if np is None:
+            return
         try:
-            import numpy as np
             samples = int(duration * sample_rate)
-            waves = np.sin(2 * np.pi * frequency * np.linspace(0, duration, samples))
+            ramp, waves, envelope = self._synth_buffers(samples)
+            dt = duration / (samples - 1)
             
-            # Apply envelope
-            envelope = np.exp(-3 * np.linspace(0, duration, samples))
-            waves = waves * envelope
+            np.multiply(ramp, np.float32(2 * np.pi * frequency * dt), out=waves)
+            np.sin(waves, out=waves)
             
-            # Convert to 16-bit integers
-            waves = (waves * 32767).astype(np.int16)
-            stereo_waves = np.column_stack((waves, waves))
+            # Apply envelope
+            np.multiply(ramp, np.float32(-3 * dt), out=envelope)
+            np.exp(envelope, out=envelope)
+            waves *= envelope
             
-            # Create sound
-            sound = pygame.sndarray.make_sound(stereo_waves)
-            self.sounds[name] = sound
-        except:
-            pass
+            self.sounds[name] = self._make_sound(waves, 32767.0)
+        except (pygame.error, ValueError):
+            pass  # Left to the silent fallback
     
     def _generate_sweep(self, name: str, start_freq: float, end_freq: float, 
                        duration: float, sample_rate: int) -> None:
         """Generate a frequency sweep sound."""
+        if np is None:
+            return
         try:
-            import numpy as np
             samples = int(duration * sample_rate)
-            t = np.linspace(0, duration, samples)
+            ramp, waves, envelope = self._synth_buffers(samples)
+            dt = duration / (samples - 1)
             
             # Linear frequency sweep
-            frequency = np.linspace(start_freq, end_freq, samples)
-            phase = 2 * np.pi * np.cumsum(frequency) / sample_rate
-            waves = np.sin(phase)
+            np.multiply(ramp, np.float32((end_freq - start_freq) / (samples - 1)), out=waves)
+            waves += np.float32(start_freq)
+            np.cumsum(waves, out=waves)
+            waves *= np.float32(2 * np.pi / sample_rate)
+            np.sin(waves, out=waves)
             
             # Apply envelope
-            envelope = np.exp(-2 * t)
-            waves = waves * envelope
-            
-            # Convert to 16-bit integers
-            waves = (waves * 16383).astype(np.int16)
-            stereo_waves = np.column_stack((waves, waves))
+            np.multiply(ramp, np.float32(-2 * dt), out=envelope)
+            np.exp(envelope, out=envelope)
+            waves *= envelope
             
-            # Create sound
-            sound = pygame.sndarray.make_sound(stereo_waves)
-            self.sounds[name] = sound
-        except:
-            pass
+            self.sounds[name] = self._make_sound(waves, 16383.0)
+        except (pygame.error, ValueError):
+            pass  # Left to the silent fallback
     
     def _generate_background(self, name: str, duration: float, sample_rate: int) -> None:
         """Generate simple background music loop."""
+        if np is None:
+            return
         try:
-            import numpy as np
             samples = int(duration * sample_rate)
-            t = np.linspace(0, duration, samples)
+            ramp, waves, scratch = self._synth_buffers(samples)
+            dt = duration / (samples - 1)
             
             # Simple chord: C major (C, E, G)
-            c_wave = np.sin(2 * np.pi * 261.63 * t) * 0.3
-            e_wave = np.sin(2 * np.pi * 329.63 * t) * 0.3
-            g_wave = np.sin(2 * np.pi * 392.00 * t) * 0.3
+            waves.fill(0.0)
+            for frequency in (261.63, 329.63, 392.00):
+                np.multiply(ramp, np.float32(2 * np.pi * frequency * dt), out=scratch)
+                np.sin(scratch, out=scratch)
+                waves += scratch
             
-            waves = c_wave + e_wave + g_wave
-            
-            # Apply gentle LFO
-            lfo = np.sin(2 * np.pi * 0.5 * t) * 0.1 + 0.9
-            waves = waves * lfo
+            # Apply gentle LFO, with the 0.3 chord gain folded into its coefficients
+            np.multiply(ramp, np.float32(2 * np.pi * 0.5 * dt), out=scratch)
+            np.sin(scratch, out=scratch)
+            scratch *= np.float32(0.3 * 0.1)
+            scratch += np.float32(0.3 * 0.9)
+            waves *= scratch
             
             # Fade in/out for seamless loop
             fade_samples = int(0.1 * sample_rate)
-            fade_in = np.linspace(0, 1, fade_samples)
-            fade_out = np.linspace(1, 0, fade_samples)
-            waves[:fade_samples] *= fade_in
-            waves[-fade_samples:] *= fade_out
-            
-            # Convert to 16-bit integers
-            waves = (waves * 8192).astype(np.int16)
-            stereo_waves = np.column_stack((waves, waves))
+            fade = scratch[:fade_samples]
+            np.multiply(ramp[:fade_samples], np.float32(1 / (fade_samples - 1)), out=fade)
+            waves[:fade_samples] *= fade
+            waves[-fade_samples:] *= fade[::-1]
             
-            # Create sound
-            sound = pygame.sndarray.make_sound(stereo_waves)
-            self.sounds[name] = sound
-        except:
-            pass
+            self.sounds[name] = self._make_sound(waves, 8192.0)
+        except (pygame.error, ValueError):
+            pass  # Left to the silent fallback
+    
+    def _make_sound(self, waves: "np.ndarray", amplitude: float) -> pygame.mixer.Sound:
+        """Scale a float32 mono buffer in place and wrap it as a 16-bit sound."""
+        waves *= np.float32(amplitude)
+        np.rint(waves, out=waves)
+        samples = waves.astype(np.int16)
+        
+        # The mixer is opened mono; only duplicate channels if the device forced more
+        channels = pygame.mixer.get_init()[2]
+        if channels > 1:
+            samples = np.repeat(samples[:, np.newaxis], channels, axis=1)
+        return pygame.sndarray.make_sound(samples)
     
     def play_sound(self, name: str, volume: float = 1.0, loop: bool = False) -> None:
-        """Play a sound by name."""
+        """Play a sound by name. A looping sound that is already playing is left running."""
         sound = self.sounds.get(name)
         if sound:
             sound.set_volume(volume)
-            if loop:
-                sound.play(-1)  # Loop infinitely
-            else:
-                sound.play()
+            if loop and self.is_sound_playing(name):
+                return
+            channel = sound.play(-1 if loop else 0)  # -1 loops infinitely
+            if channel:
+                self.playing_channels[name] = channel
     
     def is_sound_playing(self, name: str) -> bool:
         """Check if a sound is currently playing."""
-        # Check if any channels are playing our sound
-        for i in range(pygame.mixer.get_num_channels()):
-            channel = pygame.mixer.Channel(i)
-            if channel.get_busy():
-                # This is a simple check - in reality you'd need to track channels
-                # For background music, we'll use a simpler approach in the states
-                return True
-        return False
+        channel = self.playing_channels.get(name)
+        # The channel may have been reused by another sound since we started ours
+        return (channel is not None and channel.get_busy()
+                and channel.get_sound() is self.sounds.get(name))
     
     def stop_sound(self, name: str) -> None:
         """Stop a specific sound."""
-        # For simplicity, stop all sounds when stopping background music
-        if name == "background_music":
-            pygame.mixer.stop()
+        channel = self.playing_channels.pop(name, None)
+        if channel and channel.get_sound() is self.sounds.get(name):
+            channel.stop()
+
+
+# Global assets instance, created on first use. App calls get_assets() right after
+# set_mode so generated surfaces are converted to the real display format.
+_assets: Optional[Assets] = None
 
 
-# Global assets instance
-assets = Assets()
\ No newline at end of file
+def get_assets() -> Assets:
+    """Get the shared asset manager, creating it on first call."""
+    global _assets
+    if _assets is None:
+        _assets = Assets()
+    return _assets
\ No newline at end of file
@@ -1,6 +1,6 @@
 """Base game state system for managing different screens and game modes."""
 from abc import ABC, abstractmethod
-from typing import Dict, Type, Any, Optional
+from typing import Dict, Type, Any, Optional, Callable
 from enum import Enum
 import pygame
 
@@ -20,14 +20,21 @@ class StateID(Enum):
 class GameState(ABC):
     """Base class for all game states."""
     
+    # Set by states whose draw() paints every pixel, so App can skip its clear
+    clears_background: bool = False
+    
     def __init__(self, app: 'App') -> None:
         """Initialize state with reference to app."""
         self.app = app
         self.is_active = False
+        # States that only change on input clear this after drawing; App then idles
+        # instead of redrawing until an event arrives
+        self.dirty = True
     
     def enter(self, data: Optional[Dict[str, Any]] = None) -> None:
         """Called when entering this state."""
         self.is_active = True
+        self.dirty = True
         self.on_enter(data)
     
     def exit(self) -> None:
@@ -61,6 +68,10 @@ class GameState(ABC):
         pass
 
 
+def _no_state(*args: Any) -> None:
+    """Stand-in for state methods before any state is active."""
+
+
 class StateManager:
     """Manages game states and transitions."""
     
@@ -68,8 +79,13 @@ class StateManager:
         """Initialize state manager."""
         self.states: Dict[StateID, GameState] = {}
         self.current_state: Optional[GameState] = None
+        self.current_state_id: Optional[StateID] = None
         self.previous_state_id: Optional[StateID] = None
         self.transition_data: Optional[Dict[str, Any]] = None
+        # Current state's methods, rebound on each change so the loop skips the lookup
+        self._update: Callable[[float], None] = _no_state
+        self._draw: Callable[[pygame.Surface], None] = _no_state
+        self._handle: Callable[[pygame.event.Event], None] = _no_state
     
     def register_state(self, state_id: StateID, state: GameState) -> None:
         """Register a state with an ID."""
@@ -82,33 +98,29 @@ class StateManager:
         
         if self.current_state:
             self.current_state.exit()
-            for sid, state in self.states.items():
-                if state == self.current_state:
-                    self.previous_state_id = sid
-                    break
+            self.previous_state_id = self.current_state_id
         
-        self.current_state = self.states[state_id]
+        state = self.states[state_id]
+        self.current_state = state
+        self.current_state_id = state_id
+        self._update = state.update
+        self._draw = state.draw
+        self._handle = state.handle_event
         self.transition_data = data
-        self.current_state.enter(data)
+        state.enter(data)
     
     def update(self, dt: float) -> None:
         """Update current state."""
-        if self.current_state:
-            self.current_state.update(dt)
+        self._update(dt)
     
     def draw(self, screen: pygame.Surface) -> None:
         """Draw current state."""
-        if self.current_state:
-            self.current_state.draw(screen)
+        self._draw(screen)
     
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle events for current state."""
-        if self.current_state:
-            self.current_state.handle_event(event)
+        self._handle(event)
     
     def get_current_state_id(self) -> Optional[StateID]:
         """Get ID of current state."""
-        for state_id, state in self.states.items():
-            if state == self.current_state:
-                return state_id
-        return None
\ No newline at end of file
+        return self.current_state_id
\ No newline at end of file
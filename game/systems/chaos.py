@@ -36,6 +36,9 @@ class ChaosEvent(ABC):
 class PortalEvent(ChaosEvent):
     """Portal chaos event where pastries float away."""
     
+    # A list, like the brewing station's recipe, so matching needs no conversion
+    _BANISHING_RECIPE = ["beans", "moonlight", "sigil"]
+    
     def __init__(self) -> None:
         """Initialize portal event."""
         super().__init__()
@@ -85,7 +88,7 @@ class PortalEvent(ChaosEvent):
             return False
         
         # Check if it's the banishing espresso recipe
-        return data == ["beans", "moonlight", "sigil"]
+        return data == self._BANISHING_RECIPE
     
     def resolve(self) -> Dict[str, Any]:
         """Resolve portal event."""
@@ -1,17 +1,17 @@
 """Simple dialogue system for story moments."""
-import random
+from random import choice as _choice
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class DialogueLine:
     """Single line of dialogue."""
     speaker: str
     text: str
 
 
-@dataclass 
+@dataclass(slots=True)
 class DialogueScene:
     """Complete dialogue scene."""
     id: str
@@ -93,23 +93,27 @@ class DialogueManager:
                 ]
             )
         ]
+        
+        # Index every scene by id for start_scene(scene_id=...)
+        self._scene_by_id: Dict[str, DialogueScene] = {
+            scene.id: scene for ctx_scenes in self.scenes.values() for scene in ctx_scenes
+        }
     
     def get_random_scene(self, context: str) -> Optional[DialogueScene]:
         """Get a random dialogue scene for the context."""
         if context in self.scenes and self.scenes[context]:
-            return random.choice(self.scenes[context])
+            return _choice(self.scenes[context])
         return None
     
     def start_scene(self, scene_id: Optional[str] = None, context: Optional[str] = None) -> bool:
         """Start a dialogue scene."""
         if scene_id:
             # Find specific scene
-            for ctx_scenes in self.scenes.values():
-                for scene in ctx_scenes:
-                    if scene.id == scene_id:
-                        self.current_scene = scene
-                        self.current_line_index = 0
-                        return True
+            scene = self._scene_by_id.get(scene_id)
+            if scene:
+                self.current_scene = scene
+                self.current_line_index = 0
+                return True
         elif context:
             # Get random scene for context
             self.current_scene = self.get_random_scene(context)
@@ -1,11 +1,17 @@
 """Service system managing customer queue and drink brewing."""
 import json
-import random
-from typing import List, Dict, Optional, Any
-from dataclasses import dataclass
+from random import choice as _choice, uniform as _uniform
+from typing import List, Dict, Optional, Any, Sequence, Tuple
+from dataclasses import dataclass, field
 
+from .upgrades import MOD_BREW, MOD_PATIENCE
 
-@dataclass
+
+# Returned by ServiceController.update on ticks where nothing happened; read-only
+_EMPTY_EVENTS: Dict[str, Any] = {'customers_left': (), 'day_ended': False}
+
+
+@dataclass(slots=True)
 class Customer:
     """Customer entity."""
     name: str
@@ -17,24 +23,22 @@ class Customer:
     desired_recipe: Optional[str] = None
     is_visible: bool = True
     reveal_timer: float = 0.0
+    slot: int = -1  # Queue slot, assigned by CustomerQueue
+    _inv_max_patience: float = field(init=False, repr=False, compare=False)
+    _tip_span: int = field(init=False, repr=False, compare=False)
     
-    def update(self, dt: float, modifiers: Dict[str, float]) -> None:
-        """Update customer state."""
+    def __post_init__(self) -> None:
+        """Precompute values used when tipping."""
+        self._inv_max_patience = 1.0 / self.max_patience if self.max_patience else 0.0
+        self._tip_span = self.tip_range[1] - self.tip_range[0]
+    
+    def update(self, dt: float, patience_step: float) -> None:
+        """Update customer state. patience_step is this tick's modified patience decay."""
         # Patience decay
-        patience_modifier = modifiers.get('patience_decay', 1.0)
-        self.patience -= dt * patience_modifier
-        
-        # Handle ghost visibility
-        if self.quirk == "invisible" and self.reveal_timer > 0:
-            self.reveal_timer -= dt
-            if self.reveal_timer <= 0:
-                self.is_visible = False
+        self.patience -= patience_step
     
     def reveal(self, duration: float = 2.0) -> None:
-        """Reveal invisible customer."""
-        if self.quirk == "invisible":
-            self.is_visible = True
-            self.reveal_timer = duration
+        """Reveal invisible customer (only ghosts can be hidden)."""
     
     def calculate_tip(self, correct_drink: bool, remaining_patience_ratio: float) -> int:
         """Calculate tip based on service quality."""
@@ -42,21 +46,48 @@ class Customer:
             return 0
         
         base_tip = self.tip_range[0]
-        bonus = int((self.tip_range[1] - self.tip_range[0]) * remaining_patience_ratio)
+        bonus = int(self._tip_span * remaining_patience_ratio)
         return base_tip + bonus
 
 
-@dataclass
+@dataclass(slots=True)
+class InvisibleCustomer(Customer):
+    """Customer with the "invisible" quirk, only seen for a while after the bell."""
+    
+    def update(self, dt: float, patience_step: float) -> None:
+        """Update customer state. patience_step is this tick's modified patience decay."""
+        # Patience decay
+        self.patience -= patience_step
+        
+        # Handle ghost visibility
+        if self.reveal_timer > 0:
+            self.reveal_timer -= dt
+            if self.reveal_timer <= 0:
+                self.is_visible = False
+    
+    def reveal(self, duration: float = 2.0) -> None:
+        """Reveal invisible customer."""
+        self.is_visible = True
+        self.reveal_timer = duration
+
+
+@dataclass(slots=True)
 class Recipe:
     """Drink recipe."""
     id: str
     name: str
-    steps: List[str]
+    steps: Tuple[str, ...]
     difficulty: int
+    is_special: bool = False  # Chaos-event recipes, never ordered by customers
+    display_name: str = field(init=False, repr=False, compare=False)  # Name clipped for order tickets
     
-    def matches(self, steps: List[str]) -> bool:
+    def __post_init__(self) -> None:
+        """Precompute the clipped display name."""
+        self.display_name = self.name if len(self.name) <= 20 else self.name[:17] + "..."
+    
+    def matches(self, steps: Sequence[str]) -> bool:
         """Check if provided steps match recipe."""
-        return steps == self.steps
+        return tuple(steps) == self.steps
 
 
 class RecipeBook:
@@ -65,6 +96,7 @@ class RecipeBook:
     def __init__(self) -> None:
         """Initialize recipe book."""
         self.recipes: Dict[str, Recipe] = {}
+        self._regular_recipes: List[Recipe] = []
         self.load_recipes()
     
     def load_recipes(self) -> None:
@@ -72,11 +104,15 @@ class RecipeBook:
         try:
             with open('data/recipes.json', 'r') as f:
                 data = json.load(f)
-                for recipe_data in data:
-                    recipe = Recipe(**recipe_data)
-                    self.recipes[recipe.id] = recipe
+            for recipe_data in data:
+                recipe_data['steps'] = tuple(recipe_data['steps'])
+                recipe = Recipe(**recipe_data, is_special=recipe_data['id'].startswith('banishing'))
+                self.recipes[recipe.id] = recipe
         except Exception as e:
             print(f"Failed to load recipes: {e}")
+        
+        # Customers only order regular recipes; special ones are for chaos events
+        self._regular_recipes = [r for r in self.recipes.values() if not r.is_special]
     
     def find(self, recipe_id: str) -> Optional[Recipe]:
         """Find recipe by ID."""
@@ -84,9 +120,7 @@ class RecipeBook:
     
     def get_random_recipe(self) -> Recipe:
         """Get random recipe (excluding special ones)."""
-        regular_recipes = [r for r in self.recipes.values() 
-                          if not r.id.startswith('banishing')]
-        return random.choice(regular_recipes)
+        return _choice(self._regular_recipes)
 
 
 class CustomerQueue:
@@ -94,38 +128,85 @@ class CustomerQueue:
     
     def __init__(self, max_size: int = 5) -> None:
         """Initialize queue."""
+        # Slot view keeps each customer at a stable index for cards and order selection
         self.customers: List[Optional[Customer]] = [None] * max_size
+        # Dense list of waiting customers in arrival order, for iteration
+        self.active: List[Customer] = []
+        self.invisible: List[Customer] = []  # Waiting ghosts, for the bell
         self.max_size = max_size
+        self._free_slots = (1 << max_size) - 1  # Bit i set = slot i free
+        self.fire_elemental_count = 0  # Kept in step with add/remove for cafe heat
     
     def add_customer(self, customer: Customer) -> bool:
         """Add customer to queue. Returns True if successful."""
-        for i in range(self.max_size):
-            if self.customers[i] is None:
-                self.customers[i] = customer
-                return True
-        return False
+        if not self._free_slots:
+            return False
+        
+        # Take the lowest free slot
+        slot = (self._free_slots & -self._free_slots).bit_length() - 1
+        self._free_slots &= ~(1 << slot)
+        customer.slot = slot
+        self.customers[slot] = customer
+        self.active.append(customer)
+        if customer.quirk == "invisible":
+            self.invisible.append(customer)
+        if customer.species == "fire_elemental":
+            self.fire_elemental_count += 1
+        return True
     
     def remove_customer(self, index: int) -> Optional[Customer]:
         """Remove and return customer at index."""
         if 0 <= index < self.max_size:
             customer = self.customers[index]
-            self.customers[index] = None
+            if customer is not None:
+                self.customers[index] = None
+                self._free_slots |= 1 << index
+                self.active.remove(customer)
+                if customer.quirk == "invisible":
+                    self.invisible.remove(customer)
+                if customer.species == "fire_elemental":
+                    self.fire_elemental_count -= 1
             return customer
         return None
     
+    def clear(self) -> None:
+        """Remove all customers."""
+        self.customers = [None] * self.max_size
+        self.active = []
+        self.invisible = []
+        self._free_slots = (1 << self.max_size) - 1
+        self.fire_elemental_count = 0
+    
+    @property
+    def active_count(self) -> int:
+        """Number of customers currently waiting."""
+        return len(self.active)
+    
     def get_active_customers(self) -> List[Customer]:
-        """Get list of active customers."""
-        return [c for c in self.customers if c is not None]
+        """Get list of active customers (the queue's own list; do not modify)."""
+        return self.active
     
-    def update(self, dt: float, modifiers: Dict[str, float]) -> List[Customer]:
+    def update(self, dt: float, modifiers: Sequence[float]) -> List[Customer]:
         """Update all customers, return list of customers who left."""
         left_customers = []
-        for i in range(self.max_size):
-            if self.customers[i]:
-                self.customers[i].update(dt, modifiers)
-                if self.customers[i].patience <= 0:
-                    left_customers.append(self.customers[i])
-                    self.customers[i] = None
+        # Decay is the same for everyone this tick; resolve the modifier once
+        patience_step = dt * modifiers[MOD_PATIENCE]
+        for customer in self.active:
+            customer.update(dt, patience_step)
+            if customer.patience <= 0:
+                left_customers.append(customer)
+        
+        if left_customers:
+            customers = self.customers
+            for customer in left_customers:
+                slot = customer.slot
+                customers[slot] = None
+                self._free_slots |= 1 << slot
+                if customer.species == "fire_elemental":
+                    self.fire_elemental_count -= 1
+            self.active = [c for c in self.active if c.patience > 0]
+            if self.invisible:
+                self.invisible = [c for c in self.invisible if c.patience > 0]
         return left_customers
 
 
@@ -135,7 +216,9 @@ class BrewingStation:
     def __init__(self) -> None:
         """Initialize brewing station."""
         self.current_recipe: List[str] = []
-        self.available_ingredients = ["beans", "milk", "stardust", "meteor_shot", "moonlight", "sigil"]
+        # Display order; the set is for membership checks on each keypress
+        self._ingredient_order = ("beans", "milk", "stardust", "meteor_shot", "moonlight", "sigil")
+        self.available_ingredients = frozenset(self._ingredient_order)
         self.brew_time_per_step = 1.2
         self.current_brew_time = 0.0
         self.is_brewing = False
@@ -156,18 +239,17 @@ class BrewingStation:
             return True
         return False
     
-    def update(self, dt: float, modifiers: Dict[str, float]) -> bool:
+    def update(self, dt: float, modifiers: Sequence[float]) -> bool:
         """Update brewing progress. Returns True when step complete."""
         if self.is_brewing and self.current_recipe:
-            brew_speed = modifiers.get('brew_speed', 1.0)
-            self.current_brew_time += dt * brew_speed
+            self.current_brew_time += dt * modifiers[MOD_BREW]
             if self.current_brew_time >= self.brew_time_per_step:
                 return True
         return False
     
     def complete_order(self) -> List[str]:
         """Complete and return the current recipe."""
-        recipe = self.current_recipe.copy()
+        recipe = self.current_recipe  # Handed over as-is; a fresh list replaces it
         self.current_recipe = []
         self.is_brewing = False
         self.selected_customer_index = None
@@ -205,7 +287,16 @@ class ServiceController:
         """Load customer data from JSON."""
         try:
             with open('data/customers.json', 'r') as f:
-                self.customer_pool = json.load(f)
+                templates = json.load(f)
+            # Bake per-template spawn values once (ghosts start invisible)
+            self.customer_pool = [
+                {**template,
+                 'patience': float(template['patience']),
+                 'initial_visible': template.get('quirk') != "invisible",
+                 'customer_cls': (InvisibleCustomer if template.get('quirk') == "invisible"
+                                  else Customer)}
+                for template in templates
+            ]
         except Exception as e:
             print(f"Failed to load customers: {e}")
     
@@ -219,7 +310,7 @@ class ServiceController:
         self.active = True
         
         # Clear queue
-        self.customer_queue.customers = [None] * self.customer_queue.max_size
+        self.customer_queue.clear()
         
         # Spawn initial customer
         self.spawn_customer()
@@ -230,64 +321,58 @@ class ServiceController:
             return False
         
         # Pick random customer template
-        template = random.choice(self.customer_pool)
+        template = _choice(self.customer_pool)
         
         # Create customer instance
-        customer = Customer(
+        customer = template['customer_cls'](
             name=template['name'],
             species=template['species'],
             quirk=template['quirk'],
-            patience=float(template['patience']),
-            max_patience=float(template['patience']),
+            patience=template['patience'],
+            max_patience=template['patience'],
             tip_range=template['tip'],
-            desired_recipe=self.recipe_book.get_random_recipe().id
+            desired_recipe=self.recipe_book.get_random_recipe().id,
+            is_visible=template['initial_visible']
         )
         
-        # Make ghost invisible initially
-        if customer.quirk == "invisible":
-            customer.is_visible = False
-        
         return self.customer_queue.add_customer(customer)
     
-    def update(self, dt: float, modifiers: Dict[str, float]) -> Dict[str, Any]:
-        """Update service state. Returns events that occurred."""
-        events = {
-            'customers_left': [],
-            'day_ended': False
-        }
-        
+    def update(self, dt: float, modifiers: Sequence[float]) -> Dict[str, Any]:
+        """Update service state. Returns events that occurred (treat as read-only)."""
         if not self.active:
-            return events
+            return _EMPTY_EVENTS
         
         # Update time
+        day_ended = False
         self.time_remaining -= dt
         if self.time_remaining <= 0:
             self.time_remaining = 0
             self.active = False
-            events['day_ended'] = True
+            day_ended = True
+        
+        queue = self.customer_queue
         
         # Spawn timer
         self.spawn_timer -= dt
-        if self.spawn_timer <= 0 and self.customers_served + len(self.customer_queue.get_active_customers()) < 8:
+        if self.spawn_timer <= 0 and self.customers_served + queue.active_count < 8:
             if self.spawn_customer():
-                self.spawn_timer = self.spawn_interval + random.uniform(-2, 2)
+                self.spawn_timer = self.spawn_interval + _uniform(-2, 2)
         
         # Update customers
-        left_customers = self.customer_queue.update(dt, modifiers)
-        events['customers_left'] = left_customers
+        left_customers = queue.update(dt, modifiers)
         
         # Update brewing
         self.brewing_station.update(dt, modifiers)
         
         # Update cafe heat
-        has_fire_elemental = any(c and c.species == "fire_elemental" 
-                               for c in self.customer_queue.customers)
-        if has_fire_elemental:
+        if queue.fire_elemental_count > 0:
             self.cafe_heat = min(100, self.cafe_heat + dt * 10)
         else:
             self.cafe_heat = max(0, self.cafe_heat - dt * 5)
         
-        return events
+        if left_customers or day_ended:
+            return {'customers_left': left_customers, 'day_ended': day_ended}
+        return _EMPTY_EVENTS
     
     def serve_drink(self, recipe_steps: List[str]) -> Dict[str, Any]:
         """Serve drink to selected customer."""
@@ -310,7 +395,7 @@ class ServiceController:
         correct = desired_recipe and desired_recipe.matches(recipe_steps)
         
         # Calculate tip
-        patience_ratio = customer.patience / customer.max_patience
+        patience_ratio = customer.patience * customer._inv_max_patience
         tip = customer.calculate_tip(correct, patience_ratio)
         
         # Update stats
@@ -331,9 +416,8 @@ class ServiceController:
     
     def ring_bell(self) -> None:
         """Ring bell to reveal ghost customers."""
-        for customer in self.customer_queue.customers:
-            if customer and customer.quirk == "invisible":
-                customer.reveal()
+        for customer in self.customer_queue.invisible:
+            customer.reveal()
     
     def get_ice_melt_rate(self) -> float:
         """Get ice melt rate based on cafe heat."""
@@ -1,9 +1,20 @@
 """Upgrade system for permanent improvements."""
-from typing import Dict, List, Callable, Optional
+from typing import Dict, List, Callable, Optional, Set
 from dataclasses import dataclass
 
+# Positions in UpgradeManager.modifiers
+MOD_BREW = 0
+MOD_PATIENCE = 1
+MOD_TIP = 2
 
-@dataclass
+_MODIFIER_INDEX: Dict[str, int] = {
+    'brew_speed': MOD_BREW,
+    'patience_decay': MOD_PATIENCE,
+    'tip_multiplier': MOD_TIP,
+}
+
+
+@dataclass(slots=True)
 class Upgrade:
     """Upgrade definition."""
     id: str
@@ -21,12 +32,9 @@ class UpgradeManager:
     def __init__(self) -> None:
         """Initialize upgrade manager."""
         self.available_upgrades: Dict[str, Upgrade] = {}
-        self.purchased_upgrades: List[str] = []
-        self.modifiers: Dict[str, float] = {
-            'brew_speed': 1.0,
-            'patience_decay': 1.0,
-            'tip_multiplier': 1.0
-        }
+        self.purchased_upgrades: Set[str] = set()
+        self._purchase_order: List[str] = []  # For listing owned upgrades in order bought
+        self.modifiers: List[float] = [1.0, 1.0, 1.0]  # Indexed by the MOD_* constants
         
         # Initialize available upgrades
         self._init_upgrades()
@@ -73,24 +81,26 @@ class UpgradeManager:
             return None  # Can't afford or doesn't exist
         
         # Purchase upgrade
-        self.purchased_upgrades.append(upgrade_id)
+        self.purchased_upgrades.add(upgrade_id)
+        self._purchase_order.append(upgrade_id)
         self._apply_upgrade(upgrade)
         
         return coins - upgrade.cost
     
     def _apply_upgrade(self, upgrade: Upgrade) -> None:
         """Apply upgrade effects."""
-        if upgrade.effect_key in self.modifiers:
-            if upgrade.effect_key == "patience_decay":
-                # Multiply for decay (lower is better)
-                self.modifiers[upgrade.effect_key] *= upgrade.effect_value
-            else:
-                # Multiply for other effects (higher is better)
-                self.modifiers[upgrade.effect_key] *= upgrade.effect_value
+        index = _MODIFIER_INDEX.get(upgrade.effect_key)
+        if index is not None:
+            # Multiply for every effect (lower is better for decay, higher for the rest)
+            self.modifiers[index] *= upgrade.effect_value
+    
+    def get_modifiers(self) -> List[float]:
+        """Get current modifiers, indexed by the MOD_* constants (shared; do not modify)."""
+        return self.modifiers
     
-    def get_modifiers(self) -> Dict[str, float]:
-        """Get current modifiers."""
-        return self.modifiers.copy()
+    def get_modifiers_dict(self) -> Dict[str, float]:
+        """Get current modifiers keyed by effect name (for UI code)."""
+        return {key: self.modifiers[index] for key, index in _MODIFIER_INDEX.items()}
     
     def get_shop_upgrades(self) -> List[Upgrade]:
         """Get upgrades available for purchase."""
@@ -99,14 +109,11 @@ class UpgradeManager:
     
     def get_purchased_upgrades(self) -> List[Upgrade]:
         """Get list of purchased upgrades."""
-        return [self.available_upgrades[uid] for uid in self.purchased_upgrades 
+        return [self.available_upgrades[uid] for uid in self._purchase_order 
                if uid in self.available_upgrades]
     
     def reset(self) -> None:
         """Reset all upgrades (for new game)."""
         self.purchased_upgrades.clear()
-        self.modifiers = {
-            'brew_speed': 1.0,
-            'patience_decay': 1.0,
-            'tip_multiplier': 1.0
-        }
\ No newline at end of file
+        self._purchase_order.clear()
+        self.modifiers[:] = [1.0, 1.0, 1.0]  # In place, so handed-out references stay current
\ No newline at end of file
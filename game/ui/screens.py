@@ -1,16 +1,27 @@
 """All game screen implementations for different states."""
+import functools
 import pygame
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, FrozenSet
 import random
 
 from core.state import GameState, StateID
-from core.assets import assets
-from ui.widgets import Button, ProgressBar, CustomerCard, Panel, Label, DialogueBox
-from systems.service import ServiceController
+from core.assets import get_assets
+from ui.widgets import (Button, ButtonGroup, ProgressBar, CustomerCard, Panel, Label, DialogueBox, UIRenderBatch,
+                        render_text, text_width)
+from systems.service import ServiceController, Customer, Recipe
 from systems.chaos import ChaosManager
 from systems.upgrades import UpgradeManager
 from systems.dialogue import DialogueManager
 
+_PARTICLE_COLORS = [(100, 150, 200), (150, 100, 200), (200, 150, 100)]
+
+# Recipes listed in the service screen's recipe book
+_RECIPE_BOOK = [
+    {"name": "Milky Way Mocha", "steps": ["beans", "milk", "stardust"]},
+    {"name": "Flaming Meteor Espresso", "steps": ["beans", "meteor_shot"]},
+    {"name": "Banishing Espresso", "steps": ["beans", "moonlight", "sigil"]}
+]
+
 
 class MainMenuState(GameState):
     """Main menu screen."""
@@ -19,7 +30,13 @@ class MainMenuState(GameState):
         """Initialize main menu."""
         super().__init__(app)
         self.buttons: List[Button] = []
-        self.background_particles: List[Dict[str, Any]] = []
+        # Particles as parallel lists indexed by particle
+        self.particle_x: List[float] = []
+        self.particle_y: List[float] = []
+        self.particle_vel_x: List[float] = []
+        self.particle_vel_y: List[float] = []
+        self.particle_sizes: List[int] = []
+        self._particle_groups: List[Tuple[Tuple[int, int, int], List[int]]] = []  # (color, indices)
         self.background_music_playing = False
         self.init_ui()
         self.init_particles()
@@ -44,23 +61,34 @@ class MainMenuState(GameState):
                 self.quit_game
             )
         ]
+        
+        # Title and subtitle never change; render them once
+        assets = get_assets()
+        self._title_surf = render_text(assets.get_font('title'), "Eldritch Espresso", (255, 255, 255))
+        self._title_pos = (center_x - self._title_surf.get_width() // 2, 150)
+        self._subtitle_surf = render_text(assets.get_font('medium'), "Coffee for Cosmic Beings", (200, 200, 200))
+        self._subtitle_pos = (center_x - self._subtitle_surf.get_width() // 2, 190)
     
     def init_particles(self) -> None:
         """Initialize background particles."""
-        for _ in range(50):
-            self.background_particles.append({
-                'x': random.uniform(0, self.app.width),
-                'y': random.uniform(0, self.app.height),
-                'vel_x': random.uniform(-0.5, 0.5),
-                'vel_y': random.uniform(-0.8, -0.2),
-                'size': random.randint(1, 3),
-                'color': random.choice([(100, 150, 200), (150, 100, 200), (200, 150, 100)])
-            })
+        count = 50
+        self.particle_x = [random.uniform(0, self.app.width) for _ in range(count)]
+        self.particle_y = [random.uniform(0, self.app.height) for _ in range(count)]
+        self.particle_vel_x = [random.uniform(-0.5, 0.5) for _ in range(count)]
+        self.particle_vel_y = [random.uniform(-0.8, -0.2) for _ in range(count)]
+        self.particle_sizes = [random.randint(1, 3) for _ in range(count)]
+        
+        # Group particles by color so each color is looked up once per draw
+        color_indices = [random.randrange(len(_PARTICLE_COLORS)) for _ in range(count)]
+        self._particle_groups = [
+            (color, [i for i in range(count) if color_indices[i] == k])
+            for k, color in enumerate(_PARTICLE_COLORS)
+        ]
     
     def start_game(self) -> None:
         """Start the game."""
-        self.app.game_data["day"] = 1
-        self.app.game_data["coins"] = 10
+        self.app.game_data.day = 1
+        self.app.game_data.coins = 10
         self.app.state_manager.change_state(StateID.DAY_INTRO, {"day": 1})
     
     def quit_game(self) -> None:
@@ -70,57 +98,42 @@ class MainMenuState(GameState):
     def on_enter(self, data: Optional[Dict[str, Any]] = None) -> None:
         """Called when entering main menu."""
         # Play background music
-        assets.play_sound("background_music", volume=0.3, loop=True)
-        self.background_music_playing = True
+        if not self.background_music_playing:
+            get_assets().play_sound("background_music", volume=0.3, loop=True)
+            self.background_music_playing = True
     
     def on_exit(self) -> None:
         """Called when exiting main menu."""
         # Stop background music when leaving main menu
         if self.background_music_playing:
-            assets.stop_sound("background_music")
+            get_assets().stop_sound("background_music")
             self.background_music_playing = False
     
     def update(self, dt: float) -> None:
         """Update main menu."""
-        # Update particles
-        for particle in self.background_particles:
-            particle['x'] += particle['vel_x']
-            particle['y'] += particle['vel_y']
-            
-            # Wrap around screen
-            if particle['x'] < 0:
-                particle['x'] = self.app.width
-            elif particle['x'] > self.app.width:
-                particle['x'] = 0
-            
-            if particle['y'] < 0:
-                particle['y'] = self.app.height
-            elif particle['y'] > self.app.height:
-                particle['y'] = 0
+        # Update particles, wrapping around the screen
+        width, height = self.app.width, self.app.height
+        self.particle_x = [(x + vx) % width for x, vx in zip(self.particle_x, self.particle_vel_x)]
+        self.particle_y = [(y + vy) % height for y, vy in zip(self.particle_y, self.particle_vel_y)]
         
         # Background music will loop automatically since we set loop=True when starting
     
     def draw(self, screen: pygame.Surface) -> None:
         """Draw main menu."""
         # Draw particles
-        for particle in self.background_particles:
-            pygame.draw.circle(screen, particle['color'], 
-                             (int(particle['x']), int(particle['y'])), 
-                             particle['size'])
+        xs = [int(x) for x in self.particle_x]
+        ys = [int(y) for y in self.particle_y]
+        sizes = self.particle_sizes
+        draw_circle = pygame.draw.circle
+        for color, indices in self._particle_groups:
+            for i in indices:
+                draw_circle(screen, color, (xs[i], ys[i]), sizes[i])
         
         # Title
-        title_font = assets.get_font('title')
-        title_text = "Eldritch Espresso"
-        title_rect = title_font.get_rect(title_text)
-        title_pos = (self.app.width // 2 - title_rect.width // 2, 150)
-        title_font.render_to(screen, title_pos, title_text, (255, 255, 255))
+        screen.blit(self._title_surf, self._title_pos)
         
         # Subtitle
-        subtitle_font = assets.get_font('medium')
-        subtitle_text = "Coffee for Cosmic Beings"
-        subtitle_rect = subtitle_font.get_rect(subtitle_text)
-        subtitle_pos = (self.app.width // 2 - subtitle_rect.width // 2, 190)
-        subtitle_font.render_to(screen, subtitle_pos, subtitle_text, (200, 200, 200))
+        screen.blit(self._subtitle_surf, self._subtitle_pos)
         
         # Buttons
         for button in self.buttons:
@@ -135,6 +148,8 @@ class MainMenuState(GameState):
 class DayIntroState(GameState):
     """Day introduction screen with dialogue."""
     
+    clears_background = True
+    
     def __init__(self, app: 'App') -> None:
         """Initialize day intro."""
         super().__init__(app)
@@ -144,6 +159,22 @@ class DayIntroState(GameState):
         self.day_number = 1
         self.timer = 0.0
         self.auto_advance_delay = 3.0
+        self._background = self._build_background()
+        self._font_title = get_assets().get_font('title')
+        self._font_medium = get_assets().get_font('medium')
+    
+    def _build_background(self) -> pygame.Surface:
+        """Render the static background gradient."""
+        background = pygame.Surface((self.app.width, self.app.height)).convert()
+        for y in range(0, self.app.height, 4):
+            color_factor = y / self.app.height
+            color = (
+                int(20 + color_factor * 30),
+                int(20 + color_factor * 40),
+                int(40 + color_factor * 50)
+            )
+            pygame.draw.rect(background, color, (0, y, self.app.width, 4))
+        return background
     
     def advance_dialogue(self) -> None:
         """Advance dialogue or proceed to service."""
@@ -176,20 +207,12 @@ class DayIntroState(GameState):
     def draw(self, screen: pygame.Surface) -> None:
         """Draw day intro."""
         # Background gradient
-        for y in range(0, self.app.height, 4):
-            color_factor = y / self.app.height
-            color = (
-                int(20 + color_factor * 30),
-                int(20 + color_factor * 40),
-                int(40 + color_factor * 50)
-            )
-            pygame.draw.rect(screen, color, (0, y, self.app.width, 4))
+        screen.blit(self._background, (0, 0))
         
         # Day title
-        title_font = assets.get_font('title')
+        title_font = self._font_title
         title_text = f"Day {self.day_number}"
-        title_rect = title_font.get_rect(title_text)
-        title_pos = (self.app.width // 2 - title_rect.width // 2, 100)
+        title_pos = (self.app.width // 2 - text_width('title', title_text) // 2, 100)
         title_font.render_to(screen, title_pos, title_text, (255, 255, 255))
         
         # Dialogue
@@ -200,10 +223,9 @@ class DayIntroState(GameState):
             self.continue_button.draw(screen)
         else:
             # Show "Starting day..." message
-            font = assets.get_font('medium')
+            font = self._font_medium
             text = "Starting day..."
-            text_rect = font.get_rect(text)
-            text_pos = (self.app.width // 2 - text_rect.width // 2, 250)
+            text_pos = (self.app.width // 2 - text_width('medium', text) // 2, 250)
             font.render_to(screen, text_pos, text, (200, 200, 200))
     
     def handle_event(self, event: pygame.event.Event) -> None:
@@ -229,7 +251,14 @@ class ServiceState(GameState):
         
         # UI elements
         self.customer_cards: List[CustomerCard] = []
+        self._ui_batch = UIRenderBatch()  # Patience bars, drawn together after the cards
         self.ingredient_buttons: List[Button] = []
+        self._button_ingredients: List[str] = []  # Ingredient key for each ingredient button
+        self._ingredient_symbols: List[Tuple[pygame.Surface, Tuple[int, int]]] = []  # (symbol, position) per button
+        # Selected customer's order, looked up once per selection
+        self._target_customer: Optional[Customer] = None
+        self._target_recipe: Optional[Recipe] = None
+        self._needed: FrozenSet[str] = frozenset()  # Its ingredients, highlighted on the buttons
         self.status_panel = Panel(0, 500, 960, 40, "Status")
         self.bell_button = Button(850, 10, 100, 40, "Ring Bell", self.ring_bell)
         self.thermometer_rect = pygame.Rect(780, 60, 24, 48)
@@ -250,6 +279,10 @@ class ServiceState(GameState):
         
         # Order display
         self.order_tickets: List[Panel] = []
+        # Rendered ticket text, rebuilt when the waiting customers or selection change
+        self._order_text: List[Tuple[bool, pygame.Surface, pygame.Surface]] = []  # (selected, name, recipe)
+        self._order_text_customers: List[Customer] = []
+        self._order_text_selected: Optional[int] = None  # Selected queue slot
         
         # Current brewing display
         self.current_recipe_panel = Panel(300, 140, 380, 60, "Current Recipe")
@@ -258,6 +291,10 @@ class ServiceState(GameState):
         # Audio state
         self.background_music_playing = False
         
+        # Fonts used every frame
+        self._font_medium = get_assets().get_font('medium')
+        self._font_small = get_assets().get_font('small')
+        
         self.init_ui()
     
     def init_ui(self) -> None:
@@ -280,8 +317,22 @@ class ServiceState(GameState):
             y = start_y + (i // 3) * (button_size + 15)
             button = Button(x, y, button_size, button_size, 
                           ingredient.replace("_", " ").title(),
-                          lambda ing=ingredient: self.add_ingredient(ing))
+                          functools.partial(self.add_ingredient, ingredient))
             self.ingredient_buttons.append(button)
+            self._button_ingredients.append(ingredient)
+        
+        # Symbols drawn on the ingredient buttons, rendered once
+        for ingredient, button in zip(self._button_ingredients, self.ingredient_buttons):
+            symbol = self.ingredient_display_names[ingredient].split()[0]
+            symbol_surf = render_text(self._font_medium, symbol, (255, 255, 255))
+            symbol_pos = (button.rect.x + (button.rect.width - symbol_surf.get_width()) // 2,
+                          button.rect.y + 5)
+            self._ingredient_symbols.append((symbol_surf, symbol_pos))
+        self._ingredient_highlight_rects = [button.rect.inflate(6, 6) for button in self.ingredient_buttons]
+        self._ingredient_group = ButtonGroup(self.ingredient_buttons)
+        
+        # Brewing progress bar, shown while a step brews
+        self._brew_bar = ProgressBar(300, 430, 380, 15)
         
         # Recipe book panel (top middle)
         self.recipe_book_panel = Panel(300, 10, 380, 120, "Recipe Book")
@@ -291,6 +342,27 @@ class ServiceState(GameState):
         for i in range(5):
             panel = Panel(690, 10 + i * 90, ticket_width - 20, 80, f"Order {i+1}")
             self.order_tickets.append(panel)
+        self._ticket_highlight_rects = [panel.rect.inflate(4, 4) for panel in self.order_tickets]
+        
+        # Background sections never change; draw them once
+        self._background = pygame.Surface((self.app.width, 500)).convert()
+        # Customer queue area (left)
+        pygame.draw.rect(self._background, (30, 30, 40), (0, 0, 280, 500))
+        pygame.draw.line(self._background, (60, 60, 70), (280, 0), (280, 500), 2)
+        # Brewing area (middle) - wider
+        pygame.draw.rect(self._background, (25, 35, 45), (280, 0, 410, 500))
+        pygame.draw.line(self._background, (60, 60, 70), (690, 0), (690, 500), 2)
+        # Order area (right)
+        pygame.draw.rect(self._background, (35, 25, 45), (690, 0, 270, 500))
+        
+        # Static labels, rendered once
+        self._queue_title_surf = render_text(self._font_medium, "Customer Queue", (255, 255, 255))
+        self._orders_title_surf = render_text(self._font_medium, "Orders", (255, 255, 255))
+        self._ingredients_label_surf = render_text(self._font_medium, "Ingredients:", (255, 255, 255))
+        self._instruction_surf = render_text(self._font_small,
+            "Instructions: Click customer → Add ingredients → Serve", (200, 220, 200))
+        self._recipe_name_surfs = [render_text(self._font_small, recipe["name"][:18], (255, 255, 255))
+                                   for recipe in _RECIPE_BOOK]
     
     def ring_bell(self) -> None:
         """Ring bell to reveal ghost customers."""
@@ -298,18 +370,20 @@ class ServiceState(GameState):
     
     def add_ingredient(self, ingredient: str) -> None:
         """Add ingredient to current recipe."""
-        if self.service_controller.brewing_station.selected_customer_index is not None:
-            self.service_controller.brewing_station.add_ingredient(ingredient)
+        station = self.service_controller.brewing_station
+        if station.selected_customer_index is not None:
+            station.add_ingredient(ingredient)
     
     def serve_drink(self) -> None:
         """Serve the current drink."""
-        recipe = self.service_controller.brewing_station.current_recipe
-        if recipe and self.service_controller.brewing_station.selected_customer_index is not None:
+        station = self.service_controller.brewing_station
+        recipe = station.current_recipe
+        if recipe and station.selected_customer_index is not None:
             result = self.service_controller.serve_drink(recipe)
             
             # Play ding sound for correct drink
             if result and result.get('correct', False):
-                assets.play_sound("ding", volume=0.7)
+                get_assets().play_sound("ding", volume=0.7)
             
             # Check if this resolves chaos event
             if self.chaos_manager.is_active():
@@ -319,90 +393,112 @@ class ServiceState(GameState):
                     pass
             
             # Complete brewing
-            self.service_controller.brewing_station.complete_order()
+            station.complete_order()
+            self._sync_target()
     
     def cancel_order(self) -> None:
         """Cancel current order."""
         self.service_controller.brewing_station.cancel_order()
+        self._sync_target()
     
     def select_customer(self, index: int) -> None:
         """Select customer for brewing."""
         customer = self.service_controller.customer_queue.customers[index]
         if customer:
             self.service_controller.brewing_station.start_order(index)
+            self._sync_target()
+    
+    def _set_target(self, customer: Optional[Customer]) -> None:
+        """Set the customer whose order is shown as the target recipe."""
+        recipe = self.service_controller.recipe_book.find(customer.desired_recipe) if customer else None
+        self._target_customer = customer
+        self._target_recipe = recipe
+        self._needed = frozenset(recipe.steps) if recipe else frozenset()
+    
+    def _sync_target(self) -> None:
+        """Retarget if the selected slot no longer holds the cached customer."""
+        controller = self.service_controller
+        index = controller.brewing_station.selected_customer_index
+        customer = controller.customer_queue.customers[index] if index is not None else None
+        if customer is not self._target_customer:
+            self._set_target(customer)
     
     def on_enter(self, data: Optional[Dict[str, Any]] = None) -> None:
         """Called when entering service."""
         day = data.get("day", 1) if data else 1
         self.service_controller.start_day(day)
+        self._sync_target()
         self.chaos_manager.reset()
         
         # Play background music at low volume
-        assets.play_sound("background_music", volume=0.3, loop=True)
-        self.background_music_playing = True
+        if not self.background_music_playing:
+            get_assets().play_sound("background_music", volume=0.3, loop=True)
+            self.background_music_playing = True
     
     def on_exit(self) -> None:
         """Called when exiting service."""
         # Stop background music when leaving service
         if self.background_music_playing:
-            assets.stop_sound("background_music")
+            get_assets().stop_sound("background_music")
             self.background_music_playing = False
     
     def update(self, dt: float) -> None:
         """Update service state."""
+        controller = self.service_controller
         modifiers = self.upgrade_manager.get_modifiers()
         
         # Update service
-        events = self.service_controller.update(dt, modifiers)
+        events = controller.update(dt, modifiers)
         
         # Check for day end
         if events.get('day_ended'):
             results_data = {
-                'day': self.app.game_data.get('day', 1),
-                'customers_served': self.service_controller.customers_served,
-                'tips_earned': self.service_controller.total_tips,
-                'time_bonus': int(self.service_controller.time_remaining)
+                'day': self.app.game_data.day,
+                'customers_served': controller.customers_served,
+                'tips_earned': controller.total_tips,
+                'time_bonus': int(controller.time_remaining)
             }
             self.app.state_manager.change_state(StateID.DAY_RESULTS, results_data)
             return
         
-        # Update chaos events
-        self.chaos_manager.check_trigger(self.service_controller.time_remaining)
-        chaos_events = self.chaos_manager.update(dt)
+        # Follow the selected slot: its customer may have left and been replaced
+        self._sync_target()
+        
+        # Trigger the chaos event on the game clock; nothing to update until it exists
+        chaos_manager = self.chaos_manager
+        chaos_manager.check_trigger(controller.time_remaining)
+        if chaos_manager.current_event is not None:
+            chaos_manager.update(dt)
         
         # Update customer cards
-        for i, card in enumerate(self.customer_cards):
-            customer = self.service_controller.customer_queue.customers[i]
-            card.set_customer(customer)
+        for card, customer in zip(self.customer_cards, controller.customer_queue.customers):
+            if card.customer is not customer:
+                card.set_customer(customer)
             card.update(dt)
         
         # Background music will loop automatically since we set loop=True when starting
     
     def draw(self, screen: pygame.Surface) -> None:
         """Draw service screen."""
-        # Background sections
-        # Customer queue area (left)
-        pygame.draw.rect(screen, (30, 30, 40), (0, 0, 280, 500))
-        pygame.draw.line(screen, (60, 60, 70), (280, 0), (280, 500), 2)
+        controller = self.service_controller
+        station = controller.brewing_station
+        queue = controller.customer_queue
+        selected_index = station.selected_customer_index
         
-        # Brewing area (middle) - wider
-        pygame.draw.rect(screen, (25, 35, 45), (280, 0, 410, 500))
-        pygame.draw.line(screen, (60, 60, 70), (690, 0), (690, 500), 2)
-        
-        # Order area (right)
-        pygame.draw.rect(screen, (35, 25, 45), (690, 0, 270, 500))
+        # Background sections
+        screen.blit(self._background, (0, 0))
         
         # Customer queue title
-        font = assets.get_font('medium')
-        font.render_to(screen, (10, 480), "Customer Queue", (255, 255, 255))
+        screen.blit(self._queue_title_surf, (10, 480))
         
         # Customer cards
+        batch = self._ui_batch
         for card in self.customer_cards:
-            card.draw(screen)
+            card.draw(screen, batch)
+        batch.flush(screen)
             
         # Instruction text
-        instruction_font = assets.get_font('small')
-        instruction_font.render_to(screen, (290, 510), "Instructions: Click customer → Add ingredients → Serve", (200, 220, 200))
+        screen.blit(self._instruction_surf, (290, 510))
         
         # Recipe book panel
         self.recipe_book_panel.draw(screen)
@@ -413,115 +509,88 @@ class ServiceState(GameState):
         self.draw_current_recipe(screen)
         
         # Target recipe panel (when customer selected)
-        if self.service_controller.brewing_station.selected_customer_index is not None:
+        if selected_index is not None:
             self.target_recipe_panel.draw(screen)
             self.draw_target_recipe(screen)
         
         # Brewing progress (enhanced)
-        if self.service_controller.brewing_station.is_brewing and self.service_controller.brewing_station.current_recipe:
-            progress = self.service_controller.brewing_station.current_brew_time / self.service_controller.brewing_station.brew_time_per_step
-            progress_bar = ProgressBar(300, 430, 380, 15)
-            progress_bar.set_value(progress * 100)
-            progress_bar.draw(screen)
+        if station.is_brewing and station.current_recipe:
+            progress = station.current_brew_time / station.brew_time_per_step
+            self._brew_bar.set_value(progress * 100)
+            self._brew_bar.draw(screen)
             
             # Progress text
-            progress_font = assets.get_font('small')
+            progress_font = self._font_small
             progress_text = f"Brewing... {int(progress * 100)}%"
             progress_font.render_to(screen, (490 - len(progress_text) * 3, 410), progress_text, (255, 255, 150))
         
         # Ingredient buttons
         # Ingredient section label
-        ingredient_font = assets.get_font('medium')
-        ingredient_font.render_to(screen, (300, 250), "Ingredients:", (255, 255, 255))
+        screen.blit(self._ingredients_label_surf, (300, 250))
         
-        for button in self.ingredient_buttons:
+        for button, ingredient_name, (symbol_surf, symbol_pos), highlight_rect in zip(
+                self.ingredient_buttons, self._button_ingredients, self._ingredient_symbols,
+                self._ingredient_highlight_rects):
             # Make selected customer's needed ingredients more obvious
-            if self.service_controller.brewing_station.selected_customer_index is not None:
-                customer = self.service_controller.customer_queue.customers[self.service_controller.brewing_station.selected_customer_index]
-                if customer:
-                    recipe = self.service_controller.recipe_book.find(customer.desired_recipe)
-                    if recipe:
-                        # Get ingredient name from button text
-                        ingredient_name = button.text.lower().replace(" ", "_")
-                        if ingredient_name in recipe.steps:
-                            # Highlight needed ingredients
-                            highlight_rect = button.rect.inflate(6, 6)
-                            pygame.draw.rect(screen, (100, 200, 100), highlight_rect, 3)
+            if ingredient_name in self._needed:
+                pygame.draw.rect(screen, (100, 200, 100), highlight_rect, 3)
             
             button.draw(screen)
             
             # Draw ingredient icons/symbols on buttons
-            ingredient_name = button.text.lower().replace(" ", "_")
-            if ingredient_name in self.ingredient_display_names:
-                symbol = self.ingredient_display_names[ingredient_name].split()[0]
-                symbol_font = assets.get_font('medium')
-                symbol_rect = symbol_font.get_rect(symbol)
-                symbol_x = button.rect.x + (button.rect.width - symbol_rect.width) // 2
-                symbol_y = button.rect.y + 5
-                symbol_font.render_to(screen, (symbol_x, symbol_y), symbol, (255, 255, 255))
+            screen.blit(symbol_surf, symbol_pos)
         
         # Brew buttons
         self.serve_button.draw(screen)
         self.cancel_button.draw(screen)
         
         # Order tickets section
-        font.render_to(screen, (700, 480), "Orders", (255, 255, 255))
+        screen.blit(self._orders_title_surf, (700, 480))
         
         # Display customer orders (with highlighting for selected customer)
-        for i, customer in enumerate(self.service_controller.customer_queue.get_active_customers()):
-            if i < len(self.order_tickets):
-                panel = self.order_tickets[i]
-                
-                # Highlight if this customer is selected
-                selected = (self.service_controller.brewing_station.selected_customer_index is not None and 
-                           self.service_controller.customer_queue.customers[self.service_controller.brewing_station.selected_customer_index] == customer)
-                
-                if selected:
-                    # Draw highlight background
-                    highlight_rect = panel.rect.inflate(4, 4)
-                    pygame.draw.rect(screen, (100, 150, 100), highlight_rect, 3)
-                
-                panel.draw(screen)
-                
-                # Show customer name and desired recipe
-                recipe = self.service_controller.recipe_book.find(customer.desired_recipe)
-                recipe_name = recipe.name if recipe else "Unknown"
-                order_text = f"{customer.name}:"
-                recipe_text = recipe_name
-                
-                # Word wrap if too long
-                if len(recipe_text) > 20:
-                    recipe_text = recipe_text[:17] + "..."
-                
-                font = assets.get_font('small')
-                color = (150, 255, 150) if selected else (255, 255, 255)
-                font.render_to(screen, (panel.rect.x + 10, panel.rect.y + 15), order_text, color)
-                font.render_to(screen, (panel.rect.x + 10, panel.rect.y + 35), recipe_text, color)
+        active = queue.get_active_customers()
+        if (selected_index != self._order_text_selected
+                or len(active) != len(self._order_text_customers)
+                or any(a is not b for a, b in zip(active, self._order_text_customers))):
+            self._build_order_text(active, selected_index)
+        
+        for panel, highlight_rect, (selected, name_surf, recipe_surf) in zip(
+                self.order_tickets, self._ticket_highlight_rects, self._order_text):
+            if selected:
+                # Draw highlight background
+                pygame.draw.rect(screen, (100, 150, 100), highlight_rect, 3)
+            
+            panel.draw(screen)
+            
+            # Show customer name and desired recipe
+            screen.blit(name_surf, (panel.rect.x + 10, panel.rect.y + 15))
+            screen.blit(recipe_surf, (panel.rect.x + 10, panel.rect.y + 35))
         
         # Status bar
         self.status_panel.draw(screen)
+        font = self._font_small
         
         # Time remaining
-        time_text = f"Time: {self.service_controller.time_remaining:.1f}s"
+        time_text = f"Time: {controller.time_remaining:.1f}s"
         font.render_to(screen, (10, 510), time_text, (255, 255, 255))
         
         # Tips earned
-        tips_text = f"Tips: {self.service_controller.total_tips}"
+        tips_text = f"Tips: {controller.total_tips}"
         font.render_to(screen, (120, 510), tips_text, (255, 255, 255))
         
         # Customers served
-        served_text = f"Served: {self.service_controller.customers_served}"
+        served_text = f"Served: {controller.customers_served}"
         font.render_to(screen, (220, 510), served_text, (255, 255, 255))
         
         # Bell button
         self.bell_button.draw(screen)
         
         # Thermometer
-        thermometer_img = assets.get_image("thermometer")
+        thermometer_img = get_assets().get_image("thermometer")
         screen.blit(thermometer_img, self.thermometer_rect.topleft)
         
         # Heat level indicator
-        heat_ratio = self.service_controller.cafe_heat / 100.0
+        heat_ratio = controller.cafe_heat / 100.0
         heat_height = int(40 * heat_ratio)
         if heat_height > 0:
             heat_rect = pygame.Rect(785, 85 + (40 - heat_height), 14, heat_height)
@@ -529,13 +598,14 @@ class ServiceState(GameState):
             pygame.draw.rect(screen, heat_color, heat_rect)
         
         # Portal indicator during chaos
-        if self.chaos_manager.is_active():
-            portal_img = assets.get_image("portal")
+        chaos_manager = self.chaos_manager
+        if chaos_manager.is_active():
+            portal_img = get_assets().get_image("portal")
             screen.blit(portal_img, (440, 150))
             
             # Portal stability if it's a portal event
-            if hasattr(self.chaos_manager.current_event, 'rift_stability'):
-                stability = self.chaos_manager.current_event.rift_stability
+            if hasattr(chaos_manager.current_event, 'rift_stability'):
+                stability = chaos_manager.current_event.rift_stability
                 stability_text = f"Rift Stability: {stability:.1f}%"
                 font.render_to(screen, (400, 250), stability_text, (255, 100, 100))
     
@@ -546,8 +616,7 @@ class ServiceState(GameState):
         self.serve_button.handle_event(event)
         self.cancel_button.handle_event(event)
         
-        for button in self.ingredient_buttons:
-            button.handle_event(event)
+        self._ingredient_group.handle_event(event)
         
         # Customer selection
         if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -565,23 +634,34 @@ class ServiceState(GameState):
             elif event.key == pygame.K_ESCAPE:
                 self.cancel_order()
     
+    def _build_order_text(self, active: List[Customer], selected_index: Optional[int]) -> None:
+        """Render the order ticket text for the waiting customers."""
+        self._order_text = []
+        for customer in active[:len(self.order_tickets)]:
+            selected = customer.slot == selected_index
+            recipe = self.service_controller.recipe_book.find(customer.desired_recipe)
+            recipe_text = recipe.display_name if recipe else "Unknown"
+            color = (150, 255, 150) if selected else (255, 255, 255)
+            self._order_text.append((
+                selected,
+                render_text(self._font_small, f"{customer.name}:", color),
+                render_text(self._font_small, recipe_text, color)
+            ))
+        # Hold the customers themselves so identity checks stay valid
+        self._order_text_customers = list(active)
+        self._order_text_selected = selected_index
+    
     def draw_recipe_book(self, screen: pygame.Surface) -> None:
         """Draw the recipe book showing all available recipes."""
-        recipes = [
-            {"name": "Milky Way Mocha", "steps": ["beans", "milk", "stardust"]},
-            {"name": "Flaming Meteor Espresso", "steps": ["beans", "meteor_shot"]},
-            {"name": "Banishing Espresso", "steps": ["beans", "moonlight", "sigil"]}
-        ]
-        
-        font = assets.get_font('small')
+        font = self._font_small
         start_x = 310
         start_y = 35
         
-        for i, recipe in enumerate(recipes):
+        for i, recipe in enumerate(_RECIPE_BOOK):
             y_pos = start_y + i * 25
             
             # Recipe name
-            font.render_to(screen, (start_x, y_pos), recipe["name"][:18], (255, 255, 255))
+            screen.blit(self._recipe_name_surfs[i], (start_x, y_pos))
             
             # Ingredient icons
             icon_x = start_x + 140
@@ -592,7 +672,7 @@ class ServiceState(GameState):
     
     def draw_current_recipe(self, screen: pygame.Surface) -> None:
         """Draw the current recipe being brewed."""
-        font = assets.get_font('small')
+        font = self._font_small
         
         # Label
         font.render_to(screen, (310, 155), "Current Recipe:", (255, 255, 255))
@@ -614,19 +694,12 @@ class ServiceState(GameState):
     
     def draw_target_recipe(self, screen: pygame.Surface) -> None:
         """Draw the target recipe for selected customer."""
-        customer_index = self.service_controller.brewing_station.selected_customer_index
-        if customer_index is None:
-            return
-            
-        customer = self.service_controller.customer_queue.customers[customer_index]
-        if not customer:
-            return
-            
-        recipe = self.service_controller.recipe_book.find(customer.desired_recipe)
-        if not recipe:
+        customer = self._target_customer
+        recipe = self._target_recipe
+        if not customer or not recipe:
             return
         
-        font = assets.get_font('small')
+        font = self._font_small
         
         # Label with customer name
         font.render_to(screen, (310, 225), f"Target Recipe for {customer.name}:", (255, 255, 150))
@@ -654,6 +727,14 @@ class ChaosEventState(GameState):
         self.display_duration = 3.0
         self.portal_opened = False
         self.portal_closed = False
+        
+        # Overlay and title never change; build them once
+        self._overlay = pygame.Surface((app.width, app.height))
+        self._overlay.set_alpha(180)
+        self._overlay.fill((20, 0, 30))
+        self._title_surf = render_text(get_assets().get_font('title'), "Chaos Event!", (255, 100, 100))
+        self._title_pos = (app.width // 2 - self._title_surf.get_width() // 2, 200)
+        self._font_medium = get_assets().get_font('medium')
     
     def continue_game(self) -> None:
         """Continue to service."""
@@ -668,7 +749,7 @@ class ChaosEventState(GameState):
         self.portal_closed = False
         
         # Play portal opening sound
-        assets.play_sound("whoosh", volume=0.7)
+        get_assets().play_sound("whoosh", volume=0.7)
         self.portal_opened = True
     
     def on_exit(self) -> None:
@@ -681,7 +762,7 @@ class ChaosEventState(GameState):
         
         # Play portal closing sound near end
         if self.timer >= self.display_duration - 0.5 and not self.portal_closed:
-            assets.play_sound("whoosh", volume=0.7)
+            get_assets().play_sound("whoosh", volume=0.7)
             self.portal_closed = True
         
         # Auto-continue after duration
@@ -691,22 +772,14 @@ class ChaosEventState(GameState):
     def draw(self, screen: pygame.Surface) -> None:
         """Draw chaos event."""
         # Dark overlay
-        overlay = pygame.Surface((self.app.width, self.app.height))
-        overlay.set_alpha(180)
-        overlay.fill((20, 0, 30))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._overlay, (0, 0))
         
         # Event title
-        title_font = assets.get_font('title')
-        title_text = "Chaos Event!"
-        title_rect = title_font.get_rect(title_text)
-        title_pos = (self.app.width // 2 - title_rect.width // 2, 200)
-        title_font.render_to(screen, title_pos, title_text, (255, 100, 100))
+        screen.blit(self._title_surf, self._title_pos)
         
         # Event description
-        font = assets.get_font('medium')
-        text_rect = font.get_rect(self.event_text)
-        text_pos = (self.app.width // 2 - text_rect.width // 2, 250)
+        font = self._font_medium
+        text_pos = (self.app.width // 2 - text_width('medium', self.event_text) // 2, 250)
         font.render_to(screen, text_pos, self.event_text, (255, 255, 255))
         
         # Continue button
@@ -724,12 +797,17 @@ class ChaosEventState(GameState):
 class DayResultsState(GameState):
     """Day results and earnings screen."""
     
+    clears_background = True
+    
     def __init__(self, app: 'App') -> None:
         """Initialize day results."""
         super().__init__(app)
         self.dialogue_manager = DialogueManager()
         self.dialogue_box = DialogueBox(50, 350, 860, 140)
         self.continue_button = Button(400, 450, 160, 40, "Continue to Shop", self.continue_to_shop)
+        self._font_title = get_assets().get_font('title')
+        self._font_medium = get_assets().get_font('medium')
+        self.results_panel = Panel(300, 120, 360, 200, "Results")
         
         # Results data
         self.day = 1
@@ -737,11 +815,31 @@ class DayResultsState(GameState):
         self.tips_earned = 0
         self.time_bonus = 0
         self.total_earnings = 0
+        self._render_results()
+    
+    def _render_results(self) -> None:
+        """Render the day's title and results lines, which only change on entry."""
+        self._title_surf = render_text(self._font_title, f"Day {self.day} Complete!", (255, 255, 255))
+        self._title_pos = (self.app.width // 2 - self._title_surf.get_width() // 2, 50)
+        
+        results = [
+            f"Customers Served: {self.customers_served}",
+            f"Tips Earned: {self.tips_earned} coins",
+            f"Time Bonus: {self.time_bonus} coins",
+            f"Total Earned: {self.total_earnings} coins"
+        ]
+        line_height = 25
+        
+        # All lines composited onto one surface, blitted once per frame
+        surf = pygame.Surface((340, len(results) * line_height), pygame.SRCALPHA)
+        for i, line in enumerate(results):
+            self._font_medium.render_to(surf, (0, i * line_height), line, (255, 255, 255))
+        self._results_surf = surf.convert_alpha()
     
     def continue_to_shop(self) -> None:
         """Continue to upgrade shop."""
         # Update game data
-        self.app.game_data["coins"] += self.total_earnings
+        self.app.game_data.coins += self.total_earnings
         self.app.state_manager.change_state(StateID.UPGRADE_SHOP, {"day": self.day})
     
     def on_enter(self, data: Optional[Dict[str, Any]] = None) -> None:
@@ -754,9 +852,10 @@ class DayResultsState(GameState):
         
         # Calculate total earnings
         self.total_earnings = self.tips_earned + self.time_bonus
+        self._render_results()
         
         # Play ding sound when showing results
-        assets.play_sound("ding", volume=0.7)
+        get_assets().play_sound("ding", volume=0.7)
         
         # Start results dialogue
         self.dialogue_manager.start_scene(context="day_results")
@@ -775,30 +874,13 @@ class DayResultsState(GameState):
         screen.fill((25, 25, 35))
         
         # Title
-        title_font = assets.get_font('title')
-        title_text = f"Day {self.day} Complete!"
-        title_rect = title_font.get_rect(title_text)
-        title_pos = (self.app.width // 2 - title_rect.width // 2, 50)
-        title_font.render_to(screen, title_pos, title_text, (255, 255, 255))
+        screen.blit(self._title_surf, self._title_pos)
         
         # Results panel
-        panel = Panel(300, 120, 360, 200, "Results")
-        panel.draw(screen)
+        self.results_panel.draw(screen)
         
         # Results text
-        font = assets.get_font('medium')
-        y_offset = 160
-        line_height = 25
-        
-        results = [
-            f"Customers Served: {self.customers_served}",
-            f"Tips Earned: {self.tips_earned} coins",
-            f"Time Bonus: {self.time_bonus} coins",
-            f"Total Earned: {self.total_earnings} coins"
-        ]
-        
-        for i, line in enumerate(results):
-            font.render_to(screen, (320, y_offset + i * line_height), line, (255, 255, 255))
+        screen.blit(self._results_surf, (320, 160))
         
         # Dialogue
         current_line = self.dialogue_manager.get_current_line()
@@ -823,39 +905,51 @@ class DayResultsState(GameState):
 class UpgradeShopState(GameState):
     """Upgrade shop screen."""
     
+    clears_background = True
+    
     def __init__(self, app: 'App') -> None:
         """Initialize upgrade shop."""
         super().__init__(app)
         self.upgrade_manager = UpgradeManager()
         self.upgrade_buttons: List[Button] = []
+        self._upgrade_group = ButtonGroup(self.upgrade_buttons)
+        # Pre-rendered shop text as (surface, position), rebuilt with the buttons
+        self._description_ops: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
+        self._owned_ops: List[Tuple[pygame.Surface, Tuple[int, int]]] = []
         self.next_day_button = Button(400, 450, 160, 40, "Start Next Day", self.start_next_day)
         self.current_day = 1
+        self._font_title = get_assets().get_font('title')
+        self._font_medium = get_assets().get_font('medium')
+        self._font_small = get_assets().get_font('small')
+        self._title_surf = render_text(self._font_title, "Upgrade Shop", (255, 255, 255))
+        self._title_pos = (app.width // 2 - self._title_surf.get_width() // 2, 50)
     
     def start_next_day(self) -> None:
         """Start the next day."""
         # Update app modifiers from upgrades
-        self.app.game_data["modifiers"] = self.upgrade_manager.get_modifiers()
+        self.app.game_data.modifiers = self.upgrade_manager.get_modifiers_dict()
         
         # Advance day
         self.current_day += 1
-        self.app.game_data["day"] = self.current_day
+        self.app.game_data.day = self.current_day
         
         # Go to next day intro
         self.app.state_manager.change_state(StateID.DAY_INTRO, {"day": self.current_day})
     
     def purchase_upgrade(self, upgrade_id: str) -> None:
         """Purchase an upgrade."""
-        coins = self.app.game_data.get("coins", 0)
+        coins = self.app.game_data.coins
         remaining_coins = self.upgrade_manager.purchase(upgrade_id, coins)
         
         if remaining_coins is not None:
-            self.app.game_data["coins"] = remaining_coins
+            self.app.game_data.coins = remaining_coins
             self.init_upgrade_buttons()  # Refresh buttons
     
     def init_upgrade_buttons(self) -> None:
         """Initialize upgrade buttons."""
         self.upgrade_buttons.clear()
         available_upgrades = self.upgrade_manager.get_shop_upgrades()
+        coins = self.app.game_data.coins
         
         for i, upgrade in enumerate(available_upgrades):
             button = Button(
@@ -866,10 +960,27 @@ class UpgradeShopState(GameState):
             )
             
             # Disable if can't afford
-            coins = self.app.game_data.get("coins", 0)
             button.enabled = self.upgrade_manager.can_afford(upgrade.id, coins)
             
             self.upgrade_buttons.append(button)
+        
+        self._upgrade_group.refresh()
+        
+        # Upgrade descriptions and the owned list only change here
+        small_font = self._font_small
+        self._description_ops = [
+            (render_text(small_font, upgrade.description, (200, 200, 200)),
+             (button.rect.x + 10, button.rect.y + 25))
+            for upgrade, button in zip(available_upgrades, self.upgrade_buttons)
+        ]
+        
+        self._owned_ops = []
+        purchased = self.upgrade_manager.get_purchased_upgrades()
+        if purchased:
+            self._owned_ops.append(
+                (render_text(self._font_medium, "Owned Upgrades:", (255, 255, 255)), (650, 150)))
+            for i, upgrade in enumerate(purchased):
+                self._owned_ops.append((render_text(small_font, upgrade.name, (100, 255, 100)), (650, 180 + i * 25)))
     
     def on_enter(self, data: Optional[Dict[str, Any]] = None) -> None:
         """Called when entering shop."""
@@ -892,47 +1003,30 @@ class UpgradeShopState(GameState):
         screen.fill((30, 40, 30))
         
         # Title
-        title_font = assets.get_font('title')
-        title_text = "Upgrade Shop"
-        title_rect = title_font.get_rect(title_text)
-        title_pos = (self.app.width // 2 - title_rect.width // 2, 50)
-        title_font.render_to(screen, title_pos, title_text, (255, 255, 255))
+        screen.blit(self._title_surf, self._title_pos)
         
         # Coins display
-        font = assets.get_font('medium')
-        coins_text = f"Coins: {self.app.game_data.get('coins', 0)}"
+        font = self._font_medium
+        coins_text = f"Coins: {self.app.game_data.coins}"
         font.render_to(screen, (50, 100), coins_text, (255, 215, 0))
         
-        # Upgrade buttons
-        for i, button in enumerate(self.upgrade_buttons):
+        # Upgrade buttons, each with its description
+        for button, (desc_surf, desc_pos) in zip(self.upgrade_buttons, self._description_ops):
             button.draw(screen)
-            
-            # Draw upgrade description
-            upgrades = self.upgrade_manager.get_shop_upgrades()
-            if i < len(upgrades):
-                upgrade = upgrades[i]
-                desc_y = button.rect.y + 25
-                font = assets.get_font('small')
-                font.render_to(screen, (button.rect.x + 10, desc_y), upgrade.description, (200, 200, 200))
+            screen.blit(desc_surf, desc_pos)
         
         # Purchased upgrades
-        purchased = self.upgrade_manager.get_purchased_upgrades()
-        if purchased:
-            font = assets.get_font('medium')
-            font.render_to(screen, (650, 150), "Owned Upgrades:", (255, 255, 255))
-            
-            for i, upgrade in enumerate(purchased):
-                y_pos = 180 + i * 25
-                font = assets.get_font('small')
-                font.render_to(screen, (650, y_pos), upgrade.name, (100, 255, 100))
+        for surf, pos in self._owned_ops:
+            screen.blit(surf, pos)
         
         # Next day button
         self.next_day_button.draw(screen)
+        self.dirty = False
     
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle events."""
-        for button in self.upgrade_buttons:
-            button.handle_event(event)
+        self.dirty = True
+        self._upgrade_group.handle_event(event)
         
         self.next_day_button.handle_event(event)
 
@@ -940,6 +1034,8 @@ class UpgradeShopState(GameState):
 class DialogueState(GameState):
     """Full-screen dialogue state."""
     
+    clears_background = True
+    
     def __init__(self, app: 'App') -> None:
         """Initialize dialogue state."""
         super().__init__(app)
@@ -992,9 +1088,11 @@ class DialogueState(GameState):
             self.dialogue_box.show_dialogue(current_line.speaker, current_line.text)
             self.dialogue_box.draw(screen)
             self.continue_button.draw(screen)
+        self.dirty = False
     
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle events."""
+        self.dirty = True
         self.continue_button.handle_event(event)
         
         if event.type == pygame.KEYDOWN:
@@ -1011,6 +1109,12 @@ class PauseState(GameState):
         self.resume_button = Button(380, 200, 200, 50, "Resume", self.resume_game)
         self.menu_button = Button(380, 270, 200, 50, "Main Menu", self.return_to_menu)
         self.quit_button = Button(380, 340, 200, 50, "Quit", self.quit_game)
+        self.panel = Panel(300, 150, 360, 250, "Game Paused")
+        self._font_small = get_assets().get_font('small')
+        
+        # Semi-transparent overlay, built once with per-pixel alpha
+        self._overlay = pygame.Surface((app.width, app.height), pygame.SRCALPHA).convert_alpha()
+        self._overlay.fill((0, 0, 0, 180))
     
     def resume_game(self) -> None:
         """Resume the game."""
@@ -1040,14 +1144,10 @@ class PauseState(GameState):
     def draw(self, screen: pygame.Surface) -> None:
         """Draw pause screen."""
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.app.width, self.app.height))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._overlay, (0, 0))
         
         # Pause panel
-        panel = Panel(300, 150, 360, 250, "Game Paused")
-        panel.draw(screen)
+        self.panel.draw(screen)
         
         # Buttons
         self.resume_button.draw(screen)
@@ -1055,11 +1155,12 @@ class PauseState(GameState):
         self.quit_button.draw(screen)
         
         # Instructions
-        font = assets.get_font('small')
-        font.render_to(screen, (350, 420), "Press ESC to resume", (200, 200, 200))
+        self._font_small.render_to(screen, (350, 420), "Press ESC to resume", (200, 200, 200))
+        self.dirty = False
     
     def handle_event(self, event: pygame.event.Event) -> None:
         """Handle events."""
+        self.dirty = True
         self.resume_button.handle_event(event)
         self.menu_button.handle_event(event)
         self.quit_button.handle_event(event)
\ No newline at end of file
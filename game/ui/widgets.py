@@ -1,12 +1,82 @@
 """UI widget components for the game."""
+import functools
 import pygame
-from typing import Optional, Tuple, Callable, List
-from core.assets import assets
+import pygame.freetype
+from typing import Optional, Tuple, Callable, List, Dict
+from core.assets import get_assets
+
+# Shared colors, converted to pygame.Color once instead of on every draw call
+WHITE = pygame.Color(255, 255, 255)
+DIM = pygame.Color(150, 150, 150)
+RED = pygame.Color(255, 50, 50)
+YELLOW = pygame.Color(255, 200, 50)
+GREEN = pygame.Color(100, 200, 100)
+SPEAKER = pygame.Color(255, 200, 100)
+BAR_BG = pygame.Color(40, 40, 40)
+BAR_BORDER = pygame.Color(80, 80, 80)
+PANEL_BG = pygame.Color(40, 40, 50)
+PANEL_BORDER = pygame.Color(60, 60, 70)
+DIALOGUE_BG = pygame.Color(20, 20, 30)
+DIALOGUE_BORDER = pygame.Color(100, 100, 120)
+
+# Asset images scaled to widget sizes, shared by all widgets: (name, width, height) -> surface
+_scaled_images: Dict[Tuple[str, int, int], pygame.Surface] = {}
+
+
+def _get_scaled_image(name: str, width: int, height: int) -> pygame.Surface:
+    """Get an asset image scaled to the given size, scaling it only on first use."""
+    key = (name, width, height)
+    surf = _scaled_images.get(key)
+    if surf is None:
+        surf = pygame.transform.scale(get_assets().get_image(name), (width, height))
+        _scaled_images[key] = surf
+    return surf
+
+
+def render_text(font: pygame.freetype.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render text to a surface in the display's pixel format, for caching and blitting."""
+    return font.render(text, color)[0].convert_alpha()
+
+
+@functools.lru_cache(maxsize=512)
+def text_width(font_name: str, text: str) -> int:
+    """Rendered width of text in the named font, measured once per (font, text)."""
+    return get_assets().get_font(font_name).get_rect(text).width
+
+
+def _advance_width(font: pygame.freetype.Font, text: str) -> float:
+    """Sum of the glyph advances of text, which is never less than its rendered width."""
+    return sum(metrics[4] for metrics in font.get_metrics(text) if metrics)
+
+
+class UIRenderBatch:
+    """Collects widget rectangles and draws them together in one pass."""
+    
+    __slots__ = ('solids', 'outlines')
+    
+    def __init__(self) -> None:
+        """Initialize empty batch."""
+        # Layers drawn in this order: (color, rect) solids, then (color, rect, width) outlines
+        self.solids: List[Tuple[Tuple[int, int, int], pygame.Rect]] = []
+        self.outlines: List[Tuple[Tuple[int, int, int], pygame.Rect, int]] = []
+    
+    def flush(self, screen: pygame.Surface) -> None:
+        """Draw all queued solids, then all outlines, and empty the batch."""
+        fill = screen.fill
+        for color, rect in self.solids:
+            fill(color, rect)
+        draw_rect = pygame.draw.rect
+        for color, rect, width in self.outlines:
+            draw_rect(screen, color, rect, width)
+        self.solids.clear()
+        self.outlines.clear()
 
 
 class Button:
     """Clickable button widget."""
     
+    __slots__ = ('rect', 'text', 'callback', 'state', 'enabled', '_font', '_text_key', '_text_surf')
+    
     def __init__(self, x: int, y: int, width: int, height: int, 
                  text: str, callback: Optional[Callable[[], None]] = None) -> None:
         """Initialize button."""
@@ -15,6 +85,10 @@ class Button:
         self.callback = callback
         self.state = "normal"  # normal, hover, pressed
         self.enabled = True
+        self._font = get_assets().get_font('medium')
+        # Rendered label, redone only when (text, enabled) changes
+        self._text_key: Optional[Tuple[str, bool]] = None
+        self._text_surf: Optional[pygame.Surface] = None
         
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle mouse events. Returns True if button was clicked."""
@@ -43,33 +117,73 @@ class Button:
         """Draw button."""
         # Get appropriate button image
         img_name = f"button_{self.state}" if self.enabled else "button_normal"
-        button_img = assets.get_image(img_name)
         
-        # Scale to button size
-        scaled_img = pygame.transform.scale(button_img, (self.rect.width, self.rect.height))
+        # Scaled to button size
+        scaled_img = _get_scaled_image(img_name, self.rect.width, self.rect.height)
         screen.blit(scaled_img, self.rect.topleft)
         
         # Draw text
-        font = assets.get_font('medium')
-        text_color = (255, 255, 255) if self.enabled else (150, 150, 150)
-        text_rect = font.get_rect(self.text)
-        text_pos = (self.rect.centerx - text_rect.width // 2, 
-                   self.rect.centery - text_rect.height // 2)
-        font.render_to(screen, text_pos, self.text, text_color)
+        text_key = (self.text, self.enabled)
+        if text_key != self._text_key:
+            text_color = WHITE if self.enabled else DIM
+            self._text_surf = render_text(self._font, self.text, text_color)
+            self._text_key = text_key
+        text_surf = self._text_surf
+        text_pos = (self.rect.centerx - text_surf.get_width() // 2, 
+                   self.rect.centery - text_surf.get_height() // 2)
+        screen.blit(text_surf, text_pos)
+
+
+class ButtonGroup:
+    """Non-overlapping buttons that share one hover test per mouse move."""
+    
+    __slots__ = ('buttons', '_rects', '_bounds')
+    
+    def __init__(self, buttons: List[Button]) -> None:
+        """Initialize group over the given button list."""
+        self.buttons = buttons
+        self._rects: List[pygame.Rect] = []
+        self._bounds = pygame.Rect(0, 0, 0, 0)
+        self.refresh()
+    
+    def refresh(self) -> None:
+        """Re-read button rects after the button list changes."""
+        self._rects = [button.rect for button in self.buttons]
+        if self._rects:
+            self._bounds = self._rects[0].unionall(self._rects[1:])
+        else:
+            self._bounds = pygame.Rect(0, 0, 0, 0)
+    
+    def handle_event(self, event: pygame.event.Event) -> None:
+        """Pass event to the buttons, resolving mouse moves with a single rect scan."""
+        if event.type != pygame.MOUSEMOTION:
+            for button in self.buttons:
+                button.handle_event(event)
+            return
+        
+        # Bounds check first, then one collidelist call finds the hovered button
+        hit = -1
+        if self._bounds.collidepoint(event.pos):
+            hit = pygame.Rect(event.pos, (1, 1)).collidelist(self._rects)
+        for i, button in enumerate(self.buttons):
+            if button.enabled:
+                button.state = "hover" if i == hit else "normal"
 
 
 class ProgressBar:
     """Progress/timer bar widget."""
     
+    __slots__ = ('rect', 'max_value', 'current_value', 'color', 'bg_color', 'border_color')
+    
     def __init__(self, x: int, y: int, width: int, height: int,
-                 max_value: float = 100.0, color: Tuple[int, int, int] = (100, 200, 100)) -> None:
+                 max_value: float = 100.0, color: Tuple[int, int, int] = GREEN) -> None:
         """Initialize progress bar."""
         self.rect = pygame.Rect(x, y, width, height)
         self.max_value = max_value
         self.current_value = max_value
         self.color = color
-        self.bg_color = (40, 40, 40)
-        self.border_color = (80, 80, 80)
+        self.bg_color = BAR_BG
+        self.border_color = BAR_BORDER
         
     def set_value(self, value: float) -> None:
         """Set current value."""
@@ -83,94 +197,116 @@ class ProgressBar:
         """Get fill percentage (0-1)."""
         return self.current_value / self.max_value if self.max_value > 0 else 0
     
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw progress bar."""
-        # Background
-        pygame.draw.rect(screen, self.bg_color, self.rect)
+    def collect(self, solids: List[Tuple[Tuple[int, int, int], pygame.Rect]],
+                outlines: List[Tuple[Tuple[int, int, int], pygame.Rect, int]]) -> None:
+        """Append this bar's rectangles to the given draw lists instead of drawing them."""
+        rect = self.rect
+        fill_width = int(rect.width * self.get_percentage())
         
-        # Progress fill
-        fill_width = int(self.rect.width * self.get_percentage())
+        # Progress fill, with the background only behind the empty part
         if fill_width > 0:
-            fill_rect = pygame.Rect(self.rect.x, self.rect.y, fill_width, self.rect.height)
-            pygame.draw.rect(screen, self.color, fill_rect)
+            solids.append((self.color, pygame.Rect(rect.x, rect.y, fill_width, rect.height)))
+        if fill_width < rect.width:
+            solids.append((self.bg_color,
+                           pygame.Rect(rect.x + fill_width, rect.y, rect.width - fill_width, rect.height)))
         
         # Border
-        pygame.draw.rect(screen, self.border_color, self.rect, 2)
+        outlines.append((self.border_color, rect, 2))
+    
+    def draw(self, screen: pygame.Surface, batch: Optional[UIRenderBatch] = None) -> None:
+        """Draw progress bar, or queue it on batch to be drawn later."""
+        if batch is not None:
+            self.collect(batch.solids, batch.outlines)
+            return
+        
+        # Unbatched bars go through a batch of their own so collect() stays the only layout
+        own_batch = UIRenderBatch()
+        self.collect(own_batch.solids, own_batch.outlines)
+        own_batch.flush(screen)
 
 
 class CustomerCard:
     """Card displaying customer info in queue."""
     
+    __slots__ = ('rect', 'customer', 'patience_bar', 'visible', '_font', '_sprite', '_sprite_pos', '_name_pos')
+    
     def __init__(self, x: int, y: int, width: int, height: int) -> None:
         """Initialize customer card."""
         self.rect = pygame.Rect(x, y, width, height)
         self.customer = None
         self.patience_bar = ProgressBar(x + 5, y + height - 15, width - 10, 10)
         self.visible = True
+        self._font = get_assets().get_font('small')
+        # Customer sprite and text placement, resolved once per customer
+        self._sprite: Optional[pygame.Surface] = None
+        self._sprite_pos: Tuple[int, int] = (0, 0)
+        self._name_pos: Tuple[int, int] = (0, 0)
         
     def set_customer(self, customer: Optional['Customer']) -> None:
         """Set customer to display."""
         self.customer = customer
         if customer:
             self.patience_bar.max_value = customer.max_patience
-            self.patience_bar.current_value = customer.patience
-            # Set patience bar color based on urgency
-            if customer.patience / customer.max_patience < 0.3:
-                self.patience_bar.color = (255, 50, 50)  # Red
-            elif customer.patience / customer.max_patience < 0.6:
-                self.patience_bar.color = (255, 200, 50)  # Yellow
-            else:
-                self.patience_bar.color = (100, 200, 100)  # Green
+            self._show_patience(customer)
+            
+            self._sprite = get_assets().get_image(f"customer_{customer.species}")
+            self._sprite_pos = self._sprite.get_rect(center=(self.rect.centerx, self.rect.centery - 10)).topleft
+            self._name_pos = (self.rect.centerx - text_width('small', customer.name) // 2, self.rect.y + 5)
     
     def update(self, dt: float) -> None:
         """Update card."""
         if self.customer:
-            self.patience_bar.set_value(self.customer.patience)
-            # Update color
-            ratio = self.customer.patience / self.customer.max_patience
-            if ratio < 0.3:
-                self.patience_bar.color = (255, 50, 50)  # Red
-            elif ratio < 0.6:
-                self.patience_bar.color = (255, 200, 50)  # Yellow
-            else:
-                self.patience_bar.color = (100, 200, 100)  # Green
+            self._show_patience(self.customer)
     
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw customer card."""
+    def _show_patience(self, customer: 'Customer') -> None:
+        """Set the patience bar's value and urgency color."""
+        patience = customer.patience
+        self.patience_bar.set_value(patience)
+        ratio = patience / customer.max_patience
+        if ratio < 0.3:
+            self.patience_bar.color = RED
+        elif ratio < 0.6:
+            self.patience_bar.color = YELLOW
+        else:
+            self.patience_bar.color = GREEN
+    
+    def draw(self, screen: pygame.Surface, batch: Optional[UIRenderBatch] = None) -> None:
+        """Draw customer card, queuing its patience bar on batch if given."""
         if not self.customer or not self.visible:
             return
         
         # Card background
-        panel_img = assets.get_image("panel")
-        scaled_panel = pygame.transform.scale(panel_img, (self.rect.width, self.rect.height))
+        scaled_panel = _get_scaled_image("panel", self.rect.width, self.rect.height)
         screen.blit(scaled_panel, self.rect.topleft)
         
         # Customer sprite
-        sprite = assets.get_image(f"customer_{self.customer.species}")
-        sprite_rect = sprite.get_rect(center=(self.rect.centerx, self.rect.centery - 10))
-        screen.blit(sprite, sprite_rect)
+        screen.blit(self._sprite, self._sprite_pos)
         
         # Customer name
-        font = assets.get_font('small')
-        name_rect = font.get_rect(self.customer.name)
-        name_pos = (self.rect.centerx - name_rect.width // 2, self.rect.y + 5)
-        font.render_to(screen, name_pos, self.customer.name, (255, 255, 255))
+        self._font.render_to(screen, self._name_pos, self.customer.name, WHITE)
         
         # Patience bar
-        self.patience_bar.draw(screen)
+        self.patience_bar.draw(screen, batch)
 
 
 class Panel:
     """Generic UI panel."""
     
+    __slots__ = ('rect', 'title', 'color', 'border_color', 'title_color', '_font', '_title_key',
+                 '_title_surf')
+    
     def __init__(self, x: int, y: int, width: int, height: int, 
                  title: str = "", color: Optional[Tuple[int, int, int]] = None) -> None:
         """Initialize panel."""
         self.rect = pygame.Rect(x, y, width, height)
         self.title = title
-        self.color = color or (40, 40, 50)
-        self.border_color = (60, 60, 70)
-        self.title_color = (255, 255, 255)
+        self.color = color or PANEL_BG
+        self.border_color = PANEL_BORDER
+        self.title_color = WHITE
+        self._font = get_assets().get_font('medium')
+        # Rendered title, redone only when (title, title_color) changes
+        self._title_key: Optional[Tuple[str, Tuple[int, int, int]]] = None
+        self._title_surf: Optional[pygame.Surface] = None
         
     def draw(self, screen: pygame.Surface) -> None:
         """Draw panel."""
@@ -182,28 +318,38 @@ class Panel:
         
         # Title
         if self.title:
-            font = assets.get_font('medium')
-            title_rect = font.get_rect(self.title)
-            title_pos = (self.rect.centerx - title_rect.width // 2, self.rect.y + 10)
-            font.render_to(screen, title_pos, self.title, self.title_color)
+            title_key = (self.title, self.title_color)
+            if title_key != self._title_key:
+                self._title_surf = render_text(self._font, self.title, self.title_color)
+                self._title_key = title_key
+            title_pos = (self.rect.centerx - self._title_surf.get_width() // 2, self.rect.y + 10)
+            screen.blit(self._title_surf, title_pos)
 
 
 class Label:
     """Simple text label."""
     
+    __slots__ = ('x', 'y', 'text', 'font_name', 'color', '_text_key', '_text_surf')
+    
     def __init__(self, x: int, y: int, text: str, font_name: str = 'default',
-                 color: Tuple[int, int, int] = (255, 255, 255)) -> None:
+                 color: Tuple[int, int, int] = WHITE) -> None:
         """Initialize label."""
         self.x = x
         self.y = y
         self.text = text
         self.font_name = font_name
         self.color = color
+        # Rendered text, redone only when (text, font_name, color) changes
+        self._text_key: Optional[Tuple[str, str, Tuple[int, int, int]]] = None
+        self._text_surf: Optional[pygame.Surface] = None
         
     def draw(self, screen: pygame.Surface) -> None:
         """Draw label."""
-        font = assets.get_font(self.font_name)
-        font.render_to(screen, (self.x, self.y), self.text, self.color)
+        text_key = (self.text, self.font_name, self.color)
+        if text_key != self._text_key:
+            self._text_surf = render_text(get_assets().get_font(self.font_name), self.text, self.color)
+            self._text_key = text_key
+        screen.blit(self._text_surf, (self.x, self.y))
     
     def set_text(self, text: str) -> None:
         """Update label text."""
@@ -213,12 +359,23 @@ class Label:
 class DialogueBox:
     """Box for displaying dialogue."""
     
+    __slots__ = ('rect', 'speaker', 'text', 'visible', '_speaker_font', '_font', '_speaker_key',
+                 '_speaker_surf', '_wrap_key', '_wrapped_lines')
+    
     def __init__(self, x: int, y: int, width: int, height: int) -> None:
         """Initialize dialogue box."""
         self.rect = pygame.Rect(x, y, width, height)
         self.speaker = ""
         self.text = ""
         self.visible = False
+        self._speaker_font = get_assets().get_font('medium')
+        self._font = get_assets().get_font('default')
+        # Rendered "speaker:" heading, redone only when the speaker changes
+        self._speaker_key: Optional[str] = None
+        self._speaker_surf: Optional[pygame.Surface] = None
+        # Word-wrapped text, redone only when (text, width) changes
+        self._wrap_key: Optional[Tuple[str, int]] = None
+        self._wrapped_lines: List[str] = []
         
     def show_dialogue(self, speaker: str, text: str) -> None:
         """Show dialogue."""
@@ -236,34 +393,50 @@ class DialogueBox:
             return
         
         # Background
-        pygame.draw.rect(screen, (20, 20, 30), self.rect, border_radius=10)
-        pygame.draw.rect(screen, (100, 100, 120), self.rect, 3, border_radius=10)
+        pygame.draw.rect(screen, DIALOGUE_BG, self.rect, border_radius=10)
+        pygame.draw.rect(screen, DIALOGUE_BORDER, self.rect, 3, border_radius=10)
         
         # Speaker name
         if self.speaker:
-            font = assets.get_font('medium')
-            speaker_pos = (self.rect.x + 20, self.rect.y + 10)
-            font.render_to(screen, speaker_pos, self.speaker + ":", (255, 200, 100))
+            if self.speaker != self._speaker_key:
+                self._speaker_surf = render_text(self._speaker_font, self.speaker + ":", SPEAKER)
+                self._speaker_key = self.speaker
+            screen.blit(self._speaker_surf, (self.rect.x + 20, self.rect.y + 10))
         
         # Text (simple word wrap)
-        font = assets.get_font('default')
+        font = self._font
         y_offset = 40 if self.speaker else 20
+        wrap_key = (self.text, self.rect.width)
+        if wrap_key != self._wrap_key:
+            self._wrapped_lines = self._wrap_text(font)[:5]  # Max 5 lines
+            self._wrap_key = wrap_key
+        
+        for i, line in enumerate(self._wrapped_lines):
+            text_pos = (self.rect.x + 20, self.rect.y + y_offset + i * 20)
+            font.render_to(screen, text_pos, line, WHITE)
+    
+    def _wrap_text(self, font: pygame.freetype.Font) -> List[str]:
+        """Split the text into lines that fit inside the box."""
         words = self.text.split()
         lines = []
         current_line = []
+        max_width = self.rect.width - 40
+        space_width = _advance_width(font, ' ')
+        current_width = 0.0
         
+        # Measure each word once and keep a running line width
         for word in words:
-            test_line = ' '.join(current_line + [word])
-            if font.get_rect(test_line).width < self.rect.width - 40:
+            word_width = _advance_width(font, word)
+            test_width = current_width + space_width + word_width if current_line else word_width
+            if test_width < max_width:
                 current_line.append(word)
+                current_width = test_width
             else:
                 if current_line:
                     lines.append(' '.join(current_line))
                 current_line = [word]
+                current_width = word_width
         
         if current_line:
             lines.append(' '.join(current_line))
-        
-        for i, line in enumerate(lines[:5]):  # Max 5 lines
-            text_pos = (self.rect.x + 20, self.rect.y + y_offset + i * 20)
-            font.render_to(screen, text_pos, line, (255, 255, 255))
\ No newline at end of file
+        return lines
\ No newline at end of file